@@ -0,0 +1,29 @@
+# common/auth/hashing.py
+"""
+Token fingerprinting for cache and rate-limit keys.
+
+Python's built-in hash() is salted per interpreter, so keys derived from it
+differ between workers and can't be shared through Redis. Use
+token_fingerprint() wherever a bearer token needs to become a key.
+
+Usage:
+    from common.auth.hashing import token_fingerprint
+
+    key = token_fingerprint(token)          # 16 raw bytes
+    bucket = f"token:{key.hex()}"           # string form for external stores
+"""
+
+import hashlib
+
+FINGERPRINT_SIZE: int = 16
+
+
+def token_fingerprint(token: str) -> bytes:
+    """
+    Return a fixed-size, process-stable BLAKE2b digest of a token.
+
+    The whole token is hashed: tokens for different users or sessions can
+    share a long prefix, and the verified-token cache must never let a
+    token with a forged signature reuse another token's entry.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=FINGERPRINT_SIZE).digest()
@@ -32,76 +32,247 @@ Usage:
     async def get_me(user: dict = Depends(get_current_user)):
         ...
 """
+import asyncio
 import logging
 import time
+import weakref
 from typing import Annotated
 
 import httpx
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+from jose.exceptions import JWKError
 
+from common.auth.hashing import token_fingerprint
+from common.cache import TTLCache
 from common.config import settings
-from common.database.client import get_admin_client
+from common.database.client import (
+    UserScopedClient,
+    get_admin_client,
+    get_user_client,
+)
 
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
 
 # ============================================================================
-# JWKS Cache with TTL
+# JWKS Cache (background refresh, stale-while-revalidate)
 # ============================================================================
-_jwks_cache: dict | None = None
-_jwks_cache_timestamp: float = 0
-JWKS_CACHE_TTL_SECONDS: int = 3600  # 1 hour
-
-
-async def get_jwks() -> dict:
-    """
-    Fetch and cache Supabase public keys with TTL.
-    Automatically refreshes when keys expire or rotate.
-    """
-    global _jwks_cache, _jwks_cache_timestamp
-
-    current_time = time.time()
-    cache_expired = (current_time - _jwks_cache_timestamp) > JWKS_CACHE_TTL_SECONDS
-
-    if _jwks_cache is None or cache_expired:
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(settings.SUPABASE_JWKS_URL, timeout=10)
-                response.raise_for_status()
-                _jwks_cache = response.json()
-                _jwks_cache_timestamp = current_time
-                logging.info("JWKS cache refreshed successfully")
-            except httpx.TimeoutException as e:
-                logging.error(f"JWKS fetch timeout: {e}")
-                if _jwks_cache is not None:
-                    logging.warning("Using expired JWKS cache as fallback")
-                    return _jwks_cache
-                raise HTTPException(
-                    status_code=503, detail="Identity service unavailable"
-                ) from e
-            except Exception as e:
-                logging.error(f"JWKS fetch error: {e}")
-                if _jwks_cache is not None:
-                    return _jwks_cache
-                raise HTTPException(
-                    status_code=503, detail="Identity service error"
-                ) from e
+_jwks_state: dict = {
+    "keys": None,  # Raw JWKS document
+    "by_kid": {},  # {kid: parsed Key}
+    "fetched_at": 0.0,
+    "attempted_at": 0.0,  # Last fetch attempt, successful or not
+}
+_jwks_lock = asyncio.Lock()
+_jwks_refresh_task: asyncio.Task | None = None
+
+# Shared HTTP client for JWKS fetches (created on startup, reuses connections)
+_http: httpx.AsyncClient | None = None
+
+# Minimum gap between on-demand refreshes triggered by unknown kids, so
+# tokens with made-up kids can't turn into one JWKS fetch per request
+JWKS_MIN_REFRESH_INTERVAL_SECONDS: int = 30
+
+
+def _index_jwks(jwks: dict) -> dict[str, Key]:
+    """
+    Build a {kid: Key} map from a raw JWKS document.
+
+    Keys are parsed once per fetch so token validation only has to do a
+    dict lookup instead of re-parsing every JWK on each request.
+    """
+    keys: dict[str, Key] = {}
+    for key_data in jwks.get("keys", []):
+        kid = key_data.get("kid")
+        if not kid:
+            continue
+        try:
+            keys[kid] = jwk.construct(key_data, algorithm=key_data.get("alg", "ES256"))
+        except JWKError as e:
+            logging.warning(f"Skipping unusable JWK kid={kid}: {e}")
+    return keys
+
+
+async def refresh_jwks(min_interval: float = 0) -> bool:
+    """
+    Fetch Supabase public keys and swap them into the cache.
+
+    On failure the previous keys are kept (stale-while-revalidate), so a
+    transient Supabase outage never invalidates tokens that were working.
+
+    Args:
+        min_interval: Skip the fetch if another one was attempted within
+            this many seconds. Checked under the lock, so concurrent callers
+            queued behind an in-flight fetch reuse its result.
+
+    Returns:
+        True if the keys were refreshed, False if the fetch failed or
+        was skipped
+    """
+    async with _jwks_lock:
+        if time.time() - _jwks_state["attempted_at"] < min_interval:
+            return False
+
+        _jwks_state["attempted_at"] = time.time()
+        try:
+            if _http is not None:
+                response = await _http.get(settings.SUPABASE_JWKS_URL)
+            else:
+                # Refresher not started (e.g. scripts/tests): one-off client
+                async with httpx.AsyncClient() as client:
+                    response = await client.get(settings.SUPABASE_JWKS_URL, timeout=10)
+            response.raise_for_status()
+            jwks = response.json()
+        except Exception as e:
+            logging.error(f"JWKS fetch error: {e}")
+            if _jwks_state["keys"] is not None:
+                logging.warning("Keeping previous JWKS keys")
+            return False
+
+        new_keys = _index_jwks(jwks)
+        old_keys = _jwks_state["by_kid"]
+        if old_keys and new_keys.keys() != old_keys.keys():
+            # Keys rotated: drop tokens verified with the old key set
+            invalidate_token_cache()
+
+        _jwks_state.update(keys=jwks, by_kid=new_keys, fetched_at=time.time())
+        logging.info("JWKS cache refreshed successfully")
+        return True
+
+
+async def _jwks_refresh_loop() -> None:
+    """Refresh the JWKS every JWKS_CACHE_TTL_SECONDS until cancelled."""
+    while True:
+        await asyncio.sleep(settings.JWKS_CACHE_TTL_SECONDS)
+        await refresh_jwks()
+
+
+async def start_jwks_refresher() -> None:
+    """
+    Open the shared HTTP client, warm the JWKS cache and start the
+    background refresh task.
+
+    Call from the service lifespan on startup. No-op for HS256 (local dev),
+    which validates tokens with the shared secret instead.
+    """
+    global _http, _jwks_refresh_task
+
+    if settings.JWT_ALGORITHM == "HS256" or _jwks_refresh_task is not None:
+        return
 
-    return _jwks_cache
+    _http = httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=5),
+    )
+    await refresh_jwks()
+    _jwks_refresh_task = asyncio.create_task(_jwks_refresh_loop())
+
+
+async def stop_jwks_refresher() -> None:
+    """
+    Cancel the background refresh task and close the shared HTTP client.
+    Call from lifespan on shutdown.
+    """
+    global _http, _jwks_refresh_task
+
+    if _jwks_refresh_task is not None:
+        _jwks_refresh_task.cancel()
+        try:
+            await _jwks_refresh_task
+        except asyncio.CancelledError:
+            pass
+        _jwks_refresh_task = None
+
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+
+
+def get_jwks() -> dict | None:
+    """Return the cached JWKS document (None if never fetched)."""
+    return _jwks_state["keys"]
+
+
+async def get_signing_key(kid: str | None) -> Key:
+    """
+    Get the parsed public key that matches a token's `kid` header.
+
+    An unknown kid usually means Supabase rotated its keys, so the JWKS is
+    refreshed once (throttled) and the lookup retried before giving up.
+
+    Raises:
+        HTTPException 503: If no keys could ever be fetched
+        JWTError: If no key matches the kid after the refresh
+    """
+    key = _jwks_state["by_kid"].get(kid)
+    if key is not None:
+        return key
+
+    since_last_attempt = time.time() - _jwks_state["attempted_at"]
+    if since_last_attempt > JWKS_MIN_REFRESH_INTERVAL_SECONDS:
+        logging.info(f"Unknown JWKS kid={kid}, refreshing keys")
+        await refresh_jwks(min_interval=JWKS_MIN_REFRESH_INTERVAL_SECONDS)
+        key = _jwks_state["by_kid"].get(kid)
+
+    if key is not None:
+        return key
+
+    if _jwks_state["keys"] is None:
+        raise HTTPException(status_code=503, detail="Identity service unavailable")
+
+    raise JWTError(f"No signing key found for kid={kid}")
+
+
+def jwks_ready() -> bool:
+    """
+    True when tokens can be verified without a network call: keys are
+    cached (ES256) or validation uses the shared secret (HS256).
+    """
+    return settings.JWT_ALGORITHM == "HS256" or _jwks_state["keys"] is not None
 
 
 def clear_jwks_cache():
     """Clear JWKS cache. Useful for testing or forced refresh."""
-    global _jwks_cache, _jwks_cache_timestamp
-    _jwks_cache = None
-    _jwks_cache_timestamp = 0
+    _jwks_state.update(keys=None, by_kid={}, fetched_at=0.0, attempted_at=0.0)
 
 
 # ============================================================================
 # Token Validation
 # ============================================================================
+TOKEN_CACHE_MAX_SIZE: int = 10_000
+
+# Verified payloads keyed by token digest, so repeated requests with the same
+# token skip the signature check until the token (or the cache TTL) expires
+_token_cache = TTLCache(
+    maxsize=TOKEN_CACHE_MAX_SIZE, ttl=settings.AUTH_TOKEN_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_token_cache():
+    """Drop all cached token verifications (e.g. after a key rotation)."""
+    _token_cache.clear()
+
+
+def invalidate_token(token: str) -> None:
+    """
+    Drop the cached verification of a single token (e.g. on logout).
+
+    The JWT itself stays valid until `exp`; this only frees its cache slot
+    so the next request with it goes through full verification again.
+    """
+    _token_cache.pop(token_fingerprint(token), None)
+
+
+def _cache_verified_token(cache_key: bytes, payload: dict) -> None:
+    """Cache a verified payload for no longer than the token's own lifetime."""
+    exp = payload.get("exp")
+    if exp is None:
+        return
+    _token_cache.set(cache_key, payload, ttl=exp - time.time())
 
 
 async def validate_token(
@@ -110,6 +281,9 @@ async def validate_token(
     """
     Validate JWT token using dynamic strategy (HS256 local / ES256 prod).
 
+    Verified payloads are cached by token digest for up to
+    AUTH_TOKEN_CACHE_TTL_SECONDS (never past the token's `exp`).
+
     Returns:
         Decoded JWT payload
 
@@ -117,41 +291,141 @@ async def validate_token(
         HTTPException 401: If token is invalid
     """
     token = auth.credentials
+
+    cache_key = token_fingerprint(token)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         if settings.JWT_ALGORITHM == "HS256":
-            return jwt.decode(
+            payload = jwt.decode(
                 token,
                 settings.SUPABASE_JWT_SECRET,
                 algorithms=["HS256"],
                 audience=settings.JWT_AUDIENCE,
             )
         else:
-            jwks = await get_jwks()
-            return jwt.decode(
-                token, jwks, algorithms=["ES256"], audience=settings.JWT_AUDIENCE
+            header = jwt.get_unverified_header(token)
+            key = await get_signing_key(header.get("kid"))
+            payload = jwt.decode(
+                token, key, algorithms=["ES256"], audience=settings.JWT_AUDIENCE
             )
     except JWTError as e:
         logging.warning(f"Invalid token: {e}")
         raise HTTPException(status_code=401, detail="Invalid token") from e
 
+    _cache_verified_token(cache_key, payload)
+    return payload
+
 
 # ============================================================================
 # User Context
 # ============================================================================
+PROFILE_CACHE_MAX_SIZE: int = 50_000
+PROFILE_CACHE_TTL_SECONDS: int = 30
+
+# Profile rows for tokens without custom claims. A burst of requests from the
+# same user reads `profiles` once per TTL window; changes made elsewhere can
+# be up to PROFILE_CACHE_TTL_SECONDS stale unless invalidated explicitly.
+_profile_cache = TTLCache(maxsize=PROFILE_CACHE_MAX_SIZE, ttl=PROFILE_CACHE_TTL_SECONDS)
+
+# One lock per user_id so concurrent cache misses trigger a single query
+_profile_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def invalidate_profile_cache(user_id: str | None = None) -> None:
+    """
+    Drop a cached profile (or all of them if no user_id is given).
+    Call after mutating a profile so the next request sees the change.
+    """
+    if user_id is None:
+        _profile_cache.clear()
+    else:
+        _profile_cache.pop(str(user_id), None)
+
+
+async def _fetch_profile(user_id: str) -> dict:
+    """Read a profile row, reusing the cached copy when still fresh."""
+    profile = _profile_cache.get(user_id)
+    if profile is not None:
+        return profile
+
+    lock = _profile_locks.get(user_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _profile_locks[user_id] = lock
+
+    async with lock:
+        # Another request may have loaded it while we waited
+        profile = _profile_cache.get(user_id)
+        if profile is not None:
+            return profile
+
+        db = await get_admin_client()
+        response = (
+            await db.table("profiles")
+            .select("id, email, full_name, avatar_url, is_platform_admin, metadata")
+            .eq("id", user_id)
+            .limit(1)
+            .execute()
+        )
+
+        if not response.data:
+            raise HTTPException(status_code=404, detail="Profile not found")
+
+        profile = response.data[0]
+        _profile_cache.set(user_id, profile)
+        return profile
+
+
+async def _confirm_platform_admin(user: dict) -> bool:
+    """
+    Re-check `profiles.is_platform_admin` before granting platform-admin access.
+
+    The JWT claim and the cached profile can outlive a revocation, so they
+    only short-circuit the negative case; a positive answer is always read
+    fresh from the database.
+    """
+    if not user.get("is_platform_admin"):
+        return False
+
+    db = await get_admin_client()
+    response = (
+        await db.table("profiles")
+        .select("is_platform_admin")
+        .eq("id", user["id"])
+        .limit(1)
+        .execute()
+    )
+    return bool(response.data and response.data[0]["is_platform_admin"])
 
 
 async def get_current_user(
     payload: dict = Depends(validate_token),  # noqa: B008
 ) -> dict:
     """
-    Get the current user's profile from the database.
+    Get the current user's profile.
 
-    This is the base user context - it does NOT include organization roles.
-    For organization-specific permissions, use OrgRoleChecker or OrgMemberRequired.
+    Tokens issued through the `custom_access_token_hook` carry
+    `app_metadata.is_platform_admin`, so the user context is built from the
+    JWT claims without touching the database. Tokens without the claim
+    (issued before the hook was enabled) fall back to reading `profiles`,
+    cached per user for PROFILE_CACHE_TTL_SECONDS. Either source can be stale,
+    so the platform-admin dependencies re-check `profiles` before granting.
+
+    This is the base user context. Tokens from the hook also carry
+    `app_metadata.org_roles` (org_id -> role, active memberships only), exposed
+    as `org_roles`; it is None for older tokens. The claim can be stale after
+    a demotion, so it is informational only and must never grant access. For
+    header-based org context, use OrgRoleChecker or OrgMemberRequired.
 
     Returns:
         User profile dict with: id, email, full_name, avatar_url,
-        is_platform_admin, metadata
+        is_platform_admin, metadata (None when built from claims),
+        org_roles (None when built from the profile)
 
     Raises:
         HTTPException 401: If no user ID in token
@@ -162,20 +436,23 @@ async def get_current_user(
     if not user_id:
         raise HTTPException(status_code=401, detail="Token missing user identifier")
 
-    db = await get_admin_client()
-    try:
-        response = (
-            await db.table("profiles")
-            .select("id, email, full_name, avatar_url, is_platform_admin, metadata")
-            .eq("id", user_id)
-            .single()
-            .execute()
-        )
-
-        if not response.data:
-            raise HTTPException(status_code=404, detail="Profile not found")
+    app_metadata = payload.get("app_metadata") or {}
+    is_platform_admin = app_metadata.get("is_platform_admin")
+    if is_platform_admin is not None:
+        user_metadata = payload.get("user_metadata") or {}
+        return {
+            "id": user_id,
+            "email": payload.get("email"),
+            "full_name": user_metadata.get("full_name"),
+            "avatar_url": user_metadata.get("avatar_url"),
+            "is_platform_admin": bool(is_platform_admin),
+            "metadata": None,
+            "org_roles": app_metadata.get("org_roles"),
+        }
 
-        return response.data
+    try:
+        # Copy so callers can't mutate the cached row
+        return dict(await _fetch_profile(user_id))
 
     except HTTPException:
         raise
@@ -203,6 +480,18 @@ async def get_optional_user(
         return None
 
 
+async def get_user_scoped_client(
+    auth: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
+) -> UserScopedClient:
+    """
+    Database client authenticated as the caller, so RLS applies.
+
+    Use instead of `get_supabase_client` + `db.postgrest.auth(...)`, which
+    mutates the shared anon client under concurrent requests.
+    """
+    return await get_user_client(auth.credentials)
+
+
 # ============================================================================
 # Platform Admin Authorization
 # ============================================================================
@@ -228,7 +517,7 @@ class PlatformAdminRequired:
         self,
         user: dict = Depends(get_current_user),  # noqa: B008
     ) -> dict:
-        if not user.get("is_platform_admin"):
+        if not await _confirm_platform_admin(user):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Platform admin access required",
@@ -274,7 +563,8 @@ class OrgRoleChecker:
             allowed_roles: List of roles that can access this endpoint.
                            e.g., ["owner", "admin"], ["facilitador", "participante"]
         """
-        self.allowed_roles = allowed_roles
+        self.allowed_roles = frozenset(allowed_roles)
+        self._deny_msg = f"Required roles: {sorted(self.allowed_roles)}."
 
     async def __call__(
         self,
@@ -282,7 +572,7 @@ class OrgRoleChecker:
         x_organization_id: Annotated[str | None, Header()] = None,
     ) -> dict:
         # Platform Admin bypass - has access to everything
-        if user.get("is_platform_admin"):
+        if await _confirm_platform_admin(user):
             return {
                 **user,
                 "org_id": x_organization_id,  # May be None, that's OK for admins
@@ -328,9 +618,7 @@ class OrgRoleChecker:
             if user_role not in self.allowed_roles:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
-                    detail=(
-                        f"Required roles: {self.allowed_roles}. Your role: {user_role}",
-                    ),
+                    detail=f"{self._deny_msg} Your role: {user_role}",
                 )
 
             return {
@@ -366,7 +654,7 @@ class OrgMemberRequired:
         x_organization_id: Annotated[str | None, Header()] = None,
     ) -> dict:
         # Platform Admin bypass
-        if user.get("is_platform_admin"):
+        if await _confirm_platform_admin(user):
             return {
                 **user,
                 "org_id": x_organization_id,
@@ -382,7 +670,7 @@ class OrgMemberRequired:
         db = await get_admin_client()
         membership = (
             await db.table("organization_members")
-            .select("role, status")
+            .select("role")
             .eq("organization_id", x_organization_id)
             .eq("user_id", user["id"])
             .eq("status", "active")
@@ -485,7 +773,7 @@ async def verify_org_access(
         Dict with org_id and org_role
     """
     # Platform Admin bypass
-    if user.get("is_platform_admin"):
+    if await _confirm_platform_admin(user):
         return {"org_id": org_id, "org_role": "platform_admin"}
 
     membership = await verify_org_permission(
@@ -0,0 +1,89 @@
+# common/cache.py
+"""
+In-process caching helpers for OASIS services.
+
+Provides a small bounded cache with per-entry expiry, used to keep hot
+auth/reference data in memory between requests.
+
+Usage:
+    from common.cache import TTLCache
+
+    _cache = TTLCache(maxsize=1_000, ttl=60)
+
+    value = _cache.get(key)
+    if value is None:
+        value = await load_value()
+        _cache.set(key, value)
+
+Note: Caches are per-process. Each uvicorn worker keeps its own copy.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Bounded LRU cache where every entry expires after a TTL.
+
+    - Entries older than their TTL are treated as missing.
+    - When full, the least recently used entry is evicted.
+    - A per-entry TTL can be passed to `set` (capped by the default TTL).
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Maximum number of entries kept in memory
+            ttl: Default time-to-live in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or `default` if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional TTL in seconds, never longer than the default TTL
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value (expired or not)."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
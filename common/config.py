@@ -1,7 +1,5 @@
 # common/config.py
-from functools import lru_cache
-
-from pydantic import AnyHttpUrl, validator
+from pydantic import AnyHttpUrl, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +13,15 @@ class CommonSettings(BaseSettings):
     JWT_AUDIENCE: str = "authenticated"
     SUPABASE_JWT_SECRET: str
     SUPABASE_JWKS_URL: str | None = None
+    JWKS_CACHE_TTL_SECONDS: int = 3600  # Background JWKS refresh interval
+    # Seconds a verified token is reused without re-checking its signature
+    # (0 disables the cache, forcing a full verification on every request)
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = 60
+    # Max in-flight Supabase requests per process (keep below pooler limit)
+    DB_MAX_CONCURRENCY: int = 20
+    # Rate-limit counter storage, e.g. "redis://localhost:6379". Unset keeps
+    # counters in memory, so each uvicorn worker enforces its own budget.
+    RATE_LIMIT_STORAGE_URL: str | None = None
 
     # --- App Metadatos ---
 
@@ -27,10 +34,15 @@ class CommonSettings(BaseSettings):
     BACKEND_CORS_ORIGINS: list[str | AnyHttpUrl] = []
 
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", extra="ignore", case_sensitive=True
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        case_sensitive=True,
+        frozen=True,
     )
 
-    @validator("BACKEND_CORS_ORIGINS", pre=True)
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v: str | list[str]) -> list[str] | str:
         if isinstance(v, str) and not v.startswith("["):
             return [i.strip() for i in v.split(",")]
@@ -39,9 +51,9 @@ class CommonSettings(BaseSettings):
         raise ValueError(v)
 
 
-@lru_cache
-def get_settings() -> CommonSettings:
-    return CommonSettings()
+settings: CommonSettings = CommonSettings()
 
 
-settings = get_settings()
+def get_settings() -> CommonSettings:
+    """Return the process-wide settings instance."""
+    return settings
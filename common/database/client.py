@@ -5,9 +5,14 @@ Supabase client management with connection pooling.
 This module provides singleton instances of Supabase clients to avoid
 creating new connections on every request.
 
-Two clients are available:
+Three kinds of client are available:
 1. Anon client - Respects RLS policies, used for user-context operations
 2. Admin client - Bypasses RLS, used for backend-controlled operations
+3. User-scoped client - Per-request PostgREST access authenticated with the
+   caller's JWT (RLS applies)
+
+All of them send through one shared HTTP/2 connection pool (`_http`), which
+also caps in-flight requests at DB_MAX_CONCURRENCY.
 
 Usage:
     from common.database.client import get_supabase_client, get_admin_client
@@ -20,12 +25,22 @@ Usage:
         # db bypasses RLS - use carefully!
         ...
 """
+import asyncio
 import logging
+import weakref
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+from postgrest import AsyncPostgrestClient
+from postgrest.constants import (
+    DEFAULT_POSTGREST_CLIENT_HEADERS,
+    DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+)
 
 from common.config import settings
-from supabase import AsyncClient, create_async_client
+from supabase import AsyncClient, AsyncClientOptions, create_async_client
 
 # ============================================================================
 # Singleton Client Instances
@@ -33,34 +48,116 @@ from supabase import AsyncClient, create_async_client
 
 _supabase_client: AsyncClient | None = None
 _admin_client: AsyncClient | None = None
-_initialized: bool = False
+# Connection pool shared by both Supabase clients and every UserScopedClient.
+# Requests carry their own auth headers, so one pool serves all of them.
+_http: httpx.AsyncClient | None = None
 
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50)
 
-async def _ensure_clients_initialized():
-    """Initialize clients if not already done."""
-    global _supabase_client, _admin_client, _initialized
+# Serializes client creation so concurrent first callers share one init
+_init_lock = asyncio.Lock()
 
-    if _initialized:
-        return
+# Caps concurrent outbound Supabase requests so traffic spikes queue here
+# instead of exhausting the pooler's client connections. Enforced by the
+# transport of `_http`, so every client sharing the pool is covered.
+_db_sem = asyncio.Semaphore(settings.DB_MAX_CONCURRENCY)
 
-    try:
-        _supabase_client = await create_async_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_ANON_KEY,
-        )
-        logging.info("Supabase anon client initialized")
 
-        _admin_client = await create_async_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_SERVICE_ROLE_KEY,
-        )
-        logging.info("Supabase admin client initialized")
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that returns its `_db_sem` permit once it is closed."""
 
-        _initialized = True
+    def __init__(self, stream: httpx.AsyncByteStream):
+        self._stream = stream
+        self._released = False
 
-    except Exception as err:
-        logging.error(f"Failed to initialize Supabase clients: {err}")
-        raise
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                _db_sem.release()
+
+
+class _LimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that holds a `_db_sem` permit from sending a request until its
+    response body is closed (httpx closes it after reading, or on error).
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await _db_sem.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            _db_sem.release()
+            raise
+        response.stream = _ReleasingStream(response.stream)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+async def init_db_connections():
+    """
+    Create both Supabase clients.
+
+    Call this once from the service lifespan on startup so requests never
+    pay for client creation. Safe to call again: existing clients are kept.
+    """
+    global _supabase_client, _admin_client, _http
+
+    if _admin_client is not None:
+        return
+
+    async with _init_lock:
+        # Another caller may have finished initializing while we waited
+        if _admin_client is not None:
+            return
+
+        try:
+            _http = httpx.AsyncClient(
+                transport=_LimitedTransport(
+                    httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS)
+                ),
+                follow_redirects=True,
+                timeout=DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+            )
+
+            _supabase_client = await create_async_client(
+                settings.SUPABASE_URL,
+                settings.SUPABASE_ANON_KEY,
+                options=AsyncClientOptions(httpx_client=_http),
+            )
+            logging.info("Supabase anon client initialized")
+
+            _admin_client = await create_async_client(
+                settings.SUPABASE_URL,
+                settings.SUPABASE_SERVICE_ROLE_KEY,
+                options=AsyncClientOptions(httpx_client=_http),
+            )
+            logging.info("Supabase admin client initialized")
+
+        except Exception as err:
+            logging.error(f"Failed to initialize Supabase clients: {err}")
+            # Don't leak the pool; the next call starts over
+            if _http is not None:
+                await _http.aclose()
+                _http = None
+            raise
+
+
+def clients_ready() -> bool:
+    """True once the Supabase clients have been created (readiness probes)."""
+    return _admin_client is not None and _supabase_client is not None
 
 
 async def get_supabase_client() -> AsyncClient:
@@ -70,13 +167,16 @@ async def get_supabase_client() -> AsyncClient:
     This client RESPECTS Row Level Security (RLS) policies.
     Use for operations where the user's JWT should determine access.
 
-    Note: For user-context queries, you need to set the auth header:
-        db.postgrest.auth(token.credentials)
+    Note: For user-context queries prefer `get_user_scoped_client`
+    (common.auth.security): calling `db.postgrest.auth(token)` here changes
+    the headers of this shared client for every concurrent request.
 
     Returns:
         AsyncClient: Supabase client instance
     """
-    await _ensure_clients_initialized()
+    if _supabase_client is None:
+        # Not started via lifespan (scripts, tests): create lazily
+        await init_db_connections()
     return _supabase_client
 
 
@@ -94,26 +194,145 @@ async def get_admin_client() -> AsyncClient:
     Only use when the backend has already verified permissions.
     Never expose this client directly to user input.
 
+    Note: This client talks to PostgREST over HTTP, so Supavisor's pooling
+    is transparent. If a hot path is ever moved to a direct asyncpg pool,
+    create it with `statement_cache_size=0` and
+    `server_settings={"statement_timeout": "2000"}`, and use the
+    session-mode pooler (port 5432), not transaction mode (6543):
+    prepared statements break behind transaction pooling.
+
     Returns:
         AsyncClient: Admin Supabase client instance
     """
-    await _ensure_clients_initialized()
+    if _admin_client is None:
+        # Not started via lifespan (scripts, tests): create lazily
+        await init_db_connections()
     return _admin_client
 
 
+class UserScopedClient:
+    """
+    PostgREST access authenticated as a single user, so RLS applies.
+
+    Cheap to build per request: it only holds headers, and every instance
+    sends through the shared `_http` pool. Exposes the query entry
+    points the CRUD modules use on a Supabase client (`table`, `from_`,
+    `schema`, `rpc`).
+    """
+
+    def __init__(self, access_token: str, http: httpx.AsyncClient):
+        self._rest_url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1"
+        self._headers = {
+            **DEFAULT_POSTGREST_CLIENT_HEADERS,
+            "apikey": settings.SUPABASE_ANON_KEY,
+            "Authorization": f"Bearer {access_token}",
+        }
+        self._http = http
+
+    def schema(self, schema: str) -> AsyncPostgrestClient:
+        return AsyncPostgrestClient(
+            self._rest_url,
+            schema=schema,
+            headers=self._headers,
+            http_client=self._http,
+        )
+
+    def table(self, table: str):
+        return self.schema("public").from_(table)
+
+    from_ = table
+
+    def rpc(self, fn: str, params: dict | None = None, **kwargs):
+        return self.schema("public").rpc(fn, params or {}, **kwargs)
+
+
+# PostgREST clients for non-public schemas, one per (Supabase client, schema).
+# `AsyncClient.schema()` builds a new PostgREST client, with its own unclosed
+# httpx pool, on every call; these reuse the Supabase client's pool instead.
+_schema_clients: weakref.WeakKeyDictionary[
+    AsyncClient, dict[str, AsyncPostgrestClient]
+] = weakref.WeakKeyDictionary()
+
+
+def schema_client(
+    db: AsyncClient | UserScopedClient, schema: str
+) -> AsyncPostgrestClient:
+    """
+    PostgREST client for `schema` that reuses `db`'s connection pool.
+
+    Use instead of `db.schema(schema)`.
+
+    Usage:
+        await schema_client(db, "audit").from_("logs").insert(row).execute()
+    """
+    if isinstance(db, UserScopedClient):
+        return db.schema(schema)
+
+    clients = _schema_clients.setdefault(db, {})
+    client = clients.get(schema)
+    if client is None:
+        client = AsyncPostgrestClient(
+            str(db.postgrest.base_url),
+            schema=schema,
+            headers=dict(db.postgrest.headers),
+            http_client=db.options.httpx_client,
+        )
+        clients[schema] = client
+    return client
+
+
+async def get_user_client(access_token: str) -> UserScopedClient:
+    """
+    Get a client that queries PostgREST as the owner of `access_token`.
+
+    Args:
+        access_token: The caller's (already validated) Supabase JWT
+
+    Returns:
+        UserScopedClient bound to that token
+    """
+    if _http is None:
+        # Not started via lifespan (scripts, tests): create lazily
+        await init_db_connections()
+    return UserScopedClient(access_token, _http)
+
+
+def returning(builder: Any, columns: str) -> Any:
+    """
+    Choose the columns an insert/update/upsert returns, embeds included.
+
+    postgrest-py only exposes `select` on read builders, but PostgREST
+    accepts it on mutations too, so the written row and its relations come
+    back in the same response.
+
+    Usage:
+        response = await returning(
+            db.table("organization_members").update(data).eq("id", mid),
+            "role, organizations(id, name)",
+        ).execute()
+    """
+    builder.request.params = builder.request.params.add(
+        "select", "".join(columns.split())
+    )
+    return builder
+
+
 async def close_db_connections():
     """
     Close all database connections.
 
     Call this during application shutdown to cleanly release resources.
     """
-    global _supabase_client, _admin_client, _initialized
+    global _supabase_client, _admin_client, _http
+
+    # Closing the shared pool releases every client's connections
+    if _http is not None:
+        await _http.aclose()
 
-    # Note: supabase-py doesn't have explicit close() yet,
-    # but we reset the state for potential reconnection
     _supabase_client = None
     _admin_client = None
-    _initialized = False
+    _http = None
+    _schema_clients.clear()
 
     logging.info("Database connections closed")
 
@@ -122,12 +341,15 @@ async def health_check() -> dict:
     """
     Check database connectivity.
 
+    Calls the `ping()` SQL function (constant `SELECT 1`), so probes don't
+    scan or count any table.
+
     Returns:
         dict with 'healthy' boolean and optional 'error' message
     """
     try:
         db = await get_admin_client()
-        await db.table("profiles").select("id", count="exact", head=True).execute()
+        await db.rpc("ping").execute()
         return {"healthy": True}
     except Exception as err:
         logging.error(f"Database health check failed: {err}")
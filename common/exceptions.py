@@ -16,7 +16,7 @@ from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
 from common.errors import ErrorCodes
-from common.schemas.responses import ErrorDetail, OasisErrorResponse
+from common.schemas.responses import OasisErrorResponse
 
 
 class OasisException(Exception):
@@ -121,7 +121,5 @@ async def oasis_exception_handler(
     """
     return JSONResponse(
         status_code=exc.status_code,
-        content=OasisErrorResponse(
-            error=ErrorDetail(code=exc.code, message=exc.message)
-        ).model_dump(),
+        content=OasisErrorResponse.err(exc.code, exc.message).model_dump(),
     )
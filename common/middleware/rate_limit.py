@@ -27,11 +27,16 @@ from dataclasses import dataclass
 
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
+from limits.errors import ConfigurationError
+from limits.storage import storage_from_string
+from limits.strategies import STRATEGIES
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
-from common.schemas.responses import ErrorDetail, OasisErrorResponse
+from common.auth.hashing import token_fingerprint
+from common.config import settings
+from common.schemas.responses import OasisErrorResponse
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +52,8 @@ class RateLimitConfig:
 
     enabled: bool = True
     default_limit: str = "200/minute"  # Global default
-    storage_url: str | None = None  # None = in-memory, "redis://..." for Redis
+    # None = settings.RATE_LIMIT_STORAGE_URL, or in-memory if that's unset too
+    storage_url: str | None = None
 
     # Endpoint-specific defaults
     auth_limit: str = "20/minute"  # Login, register (prevent brute force)
@@ -79,9 +85,11 @@ def get_user_or_ip(request: Request) -> str:
     auth_header = request.headers.get("Authorization", "")
     if auth_header.startswith("Bearer "):
         # Don't decode JWT here, just use token hash as key
-        # This groups requests by token without validation overhead
+        # This groups requests by token without validation overhead.
+        # The fingerprint is stable across workers (unlike hash()), which a
+        # shared Redis storage backend relies on.
         token = auth_header[7:]
-        return f"token:{hash(token) % 10**10}"
+        return f"token:{token_fingerprint(token).hex()}"
 
     # Fallback to IP
     return f"ip:{get_remote_address(request)}"
@@ -126,11 +134,9 @@ async def rate_limit_exceeded_handler(
 
     return JSONResponse(
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-        content=OasisErrorResponse(
-            error=ErrorDetail(
-                code="rate_limit_exceeded",
-                message=f"Demasiadas solicitudes. Intenta de nuevo en {retry_after}.",
-            )
+        content=OasisErrorResponse.err(
+            "rate_limit_exceeded",
+            f"Demasiadas solicitudes. Intenta de nuevo en {retry_after}.",
         ).model_dump(),
         headers={
             "Retry-After": "60",  # Suggest retry after 60 seconds
@@ -144,6 +150,20 @@ async def rate_limit_exceeded_handler(
 # =============================================================================
 
 
+def _use_storage(storage_url: str) -> None:
+    """
+    Point the global limiter at another storage backend.
+
+    The limiter builds its storage on construction, so swapping the URI
+    alone has no effect; rebuild the storage and the strategy on top of it.
+    With Redis, each hit is a single round trip (INCR + EXPIRE pipelined by
+    `limits`) against one connection pool shared by all requests.
+    """
+    limiter._storage_uri = storage_url
+    limiter._storage = storage_from_string(storage_url)
+    limiter._limiter = STRATEGIES[limiter._strategy](limiter._storage)
+
+
 def setup_rate_limiting(
     app: FastAPI,
     config: RateLimitConfig | None = None,
@@ -167,16 +187,17 @@ def setup_rate_limiting(
         return
 
     # Configure storage backend
-    if config.storage_url:
+    storage_url = config.storage_url or settings.RATE_LIMIT_STORAGE_URL
+    if storage_url:
         # Redis storage for distributed rate limiting
         try:
             from slowapi.middleware import SlowAPIMiddleware
 
-            limiter._storage_url = config.storage_url
+            _use_storage(storage_url)
             app.add_middleware(SlowAPIMiddleware)
-            logger.info(f"Rate limiting using Redis: {config.storage_url}")
-        except ImportError:
-            logger.warning("Redis not available, using in-memory storage")
+            logger.info(f"Rate limiting using Redis: {storage_url}")
+        except (ImportError, ConfigurationError) as e:
+            logger.warning(f"Redis not available, using in-memory storage: {e}")
 
     # Update default limits
     limiter._default_limits = [config.default_limit]
@@ -1,18 +1,25 @@
 from typing import Any
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict
+
+from common.schemas.base import FastEmail
 
 
 class ProfileOut(BaseModel):
     """
     El 'Pasaporte' del usuario.
     Este modelo es seguro y compartido por todos los microservicios.
+
+    Mirrors the user context returned by `get_current_user`. Build it with
+    `ProfileOut.model_construct(**user)` when the dict comes from a verified
+    token or a DB row, to skip re-validation.
     """
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
     id: str
-    email: EmailStr
+    email: FastEmail
+    full_name: str | None = None
+    avatar_url: str | None = None
     is_platform_admin: bool = False
-    metadata: dict[str, Any] | None = Field(default_factory=dict)
-
-    class Config:
-        from_attributes = True
+    metadata: dict[str, Any] | None = None
@@ -17,6 +17,22 @@ class OasisResponse(BaseModel, Generic[T]):
         None, description="Metadatos (paginación, trace_id, etc)."
     )
 
+    @classmethod
+    def ok(
+        cls,
+        data: Any = None,
+        *,
+        message: str | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> "OasisResponse":
+        """
+        Build a success envelope without re-validating `data`.
+
+        Handlers pass data that is already validated (DB rows, schema
+        instances); FastAPI still serializes it through `response_model`.
+        """
+        return cls.model_construct(success=True, message=message, data=data, meta=meta)
+
 
 class ErrorDetail(BaseModel):
     code: str
@@ -26,3 +42,10 @@ class ErrorDetail(BaseModel):
 class OasisErrorResponse(BaseModel):
     success: bool = False
     error: ErrorDetail
+
+    @classmethod
+    def err(cls, code: str, message: str) -> "OasisErrorResponse":
+        """Build an error envelope from trusted values without validation."""
+        return cls.model_construct(
+            success=False, error=ErrorDetail.model_construct(code=code, message=message)
+        )
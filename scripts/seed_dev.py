@@ -8,23 +8,25 @@ which generates real audit logs just like production usage.
 REQUIRES: API must be running (uvicorn services.auth_service.main:app)
 
 Usage:
-    python scripts/seed_dev.py              # Full seed
-    python scripts/seed_dev.py --clean      # Clean and reseed
-    python scripts/seed_dev.py --api-url http://localhost:8001  # Custom API URL
+    python -m scripts.seed_dev              # Full seed
+    python -m scripts.seed_dev --clean      # Clean and reseed
+    python -m scripts.seed_dev --api-url http://localhost:8001  # Custom API URL
 
 Requirements:
     - API running at localhost:8000 (or specify --api-url)
-    - SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY in .env (for admin operations)
+    - The services' .env (loaded through common.config.settings); SUPABASE_URL
+      and SUPABASE_SERVICE_ROLE_KEY are used for admin operations
 """
 import argparse
-import os
+import asyncio
 import sys
 from dataclasses import dataclass, field
 
 import httpx
-from dotenv import load_dotenv
 
-from supabase import Client, create_client
+from common.config import settings
+from common.database.client import schema_client
+from supabase import AsyncClient, AsyncClientOptions, create_async_client
 
 # =============================================================================
 # CONFIGURATION
@@ -33,8 +35,16 @@ from supabase import Client, create_client
 DEFAULT_API_URL = "http://localhost:8000/api/v1"
 DEFAULT_PASSWORD = "Test123!"
 
+# One keep-alive pool per client, sized for the concurrent seed phases
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+# Fail fast when the API/Supabase is down, but allow slow seed writes
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
 
-@dataclass
+# Max in-flight API / Supabase Auth calls, to stay under GoTrue rate limits
+MAX_CONCURRENCY = 10
+
+
+@dataclass(slots=True, frozen=True)
 class OrgConfig:
     """Organization configuration."""
 
@@ -45,7 +55,7 @@ class OrgConfig:
     settings: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserConfig:
     """User configuration."""
 
@@ -149,38 +159,75 @@ DEV_USERS = [
 
 
 class DevSeeder:
-    """Seeds development data using API endpoints."""
+    """
+    Seeds development data using API endpoints.
+
+    Use as an async context manager so the Supabase client is created and
+    the HTTP client closed:
+
+        async with DevSeeder(api_url, supabase_url, key) as seeder:
+            await seeder.seed_all()
+    """
 
     def __init__(self, api_url: str, supabase_url: str, service_role_key: str):
         self.api_url = api_url.rstrip("/")
-        self.supabase: Client = create_client(supabase_url, service_role_key)
-        self.http = httpx.Client(timeout=30.0)
+        self.supabase_url = supabase_url
+        self.service_role_key = service_role_key
+        self.supabase: AsyncClient | None = None
+        self.http = httpx.AsyncClient(
+            base_url=self.api_url,
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+            http2=True,
+        )
+        # Shared by every Supabase sub-client (auth, postgrest) so all DB
+        # calls reuse the same connections
+        self.supabase_http = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, http2=True
+        )
 
         self.org_ids: dict[str, str] = {}  # slug -> id
         self.user_ids: dict[str, str] = {}  # email -> id
         self.user_tokens: dict[str, str] = {}  # email -> access_token
         self.admin_token: str | None = None
-
-    def check_api_health(self) -> bool:
+        self._sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def __aenter__(self) -> "DevSeeder":
+        self.supabase = await create_async_client(
+            self.supabase_url,
+            self.service_role_key,
+            options=AsyncClientOptions(httpx_client=self.supabase_http),
+        )
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.http.aclose()
+        await self.supabase_http.aclose()
+
+    async def _bounded(self, coro):
+        """Await `coro` while holding one of the MAX_CONCURRENCY slots."""
+        async with self._sem:
+            return await coro
+
+    async def check_api_health(self) -> bool:
         """Verify API is running."""
         try:
             # Try the OpenAPI endpoint which should always exist
-            response = self.http.get(f"{self.api_url}/openapi.json")
+            response = await self.http.get("/openapi.json")
             if response.status_code == 200:
                 return True
             # Fallback: try docs
-            response = self.http.get(f"{self.api_url}/docs")
+            response = await self.http.get("/docs")
             return response.status_code == 200
         except httpx.ConnectError:
             return False
 
     def check_environment(self) -> bool:
         """Safety checks before seeding."""
-        url = os.getenv("SUPABASE_URL", "")
+        url = settings.SUPABASE_URL
 
         if "supabase.co" in url and "local" not in url:
-            env = os.getenv("ENVIRONMENT", "").lower()
-            if env == "production":
+            if settings.ENVIRONMENT.lower() == "production":
                 print("❌ ERROR: Cannot run seed in PRODUCTION!")
                 return False
 
@@ -191,41 +238,76 @@ class DevSeeder:
 
         return True
 
-    def clean_data(self) -> None:
+    async def clean_data(self) -> None:
         """Remove test data."""
         print("\n🧹 Cleaning existing data...")
 
-        for user in DEV_USERS:
-            try:
-                profile = (
-                    self.supabase.table("profiles")
-                    .select("id")
-                    .eq("email", user.email)
-                    .execute()
-                )
-                if profile.data:
-                    user_id = profile.data[0]["id"]
-                    self.supabase.auth.admin.delete_user(user_id)
-                    print(f"   🗑️  Deleted: {user.email}")
-            except Exception as e:
-                print(f"   ⚠️  Could not delete {user.email}: {e}")
+        await self.prefetch_ids()
 
-        for org in DEV_ORGANIZATIONS:
-            try:
-                self.supabase.table("organizations").delete().eq(
-                    "slug", org.slug
-                ).execute()
-                print(f"   🗑️  Deleted org: {org.slug}")
-            except Exception:
-                pass
+        await asyncio.gather(
+            *(
+                self._bounded(self._delete_user(email, user_id))
+                for email, user_id in self.user_ids.items()
+            )
+        )
+
+        try:
+            deleted = (
+                await self.supabase.table("organizations")
+                .delete()
+                .in_("slug", [org.slug for org in DEV_ORGANIZATIONS])
+                .execute()
+            )
+            for org in deleted.data or []:
+                print(f"   🗑️  Deleted org: {org['slug']}")
+        except Exception as e:
+            print(f"   ⚠️  Could not delete orgs: {e}")
 
+        self.user_ids.clear()
+        self.org_ids.clear()
         print("   ✅ Cleanup complete")
 
-    def register_user(self, user: UserConfig) -> str | None:
-        """Register user via API endpoint."""
+    async def _delete_user(self, email: str, user_id: str) -> None:
+        """Delete a user through the Supabase Auth admin API."""
+        try:
+            await self.supabase.auth.admin.delete_user(user_id)
+            print(f"   🗑️  Deleted: {email}")
+        except Exception as e:
+            print(f"   ⚠️  Could not delete {email}: {e}")
+
+    async def prefetch_ids(self) -> None:
+        """
+        Load ids of already-seeded users and orgs with one query each, so
+        reruns resolve existing rows from memory instead of per-item lookups.
+        """
+        try:
+            profiles = (
+                await self.supabase.table("profiles")
+                .select("id, email")
+                .in_("email", [user.email for user in DEV_USERS])
+                .execute()
+            )
+            self.user_ids.update({p["email"]: p["id"] for p in profiles.data or []})
+
+            orgs = (
+                await self.supabase.table("organizations")
+                .select("id, slug")
+                .in_("slug", [org.slug for org in DEV_ORGANIZATIONS])
+                .execute()
+            )
+            self.org_ids.update({o["slug"]: o["id"] for o in orgs.data or []})
+        except Exception as e:
+            print(f"   ⚠️  Could not prefetch existing ids: {e}")
+
+    async def register_user(self, user: UserConfig) -> str | None:
+        """Register user via API endpoint (skipped if already seeded)."""
+        if user.email in self.user_ids:
+            print(f"   ℹ️  Already exists: {user.email}")
+            return self.user_ids[user.email]
+
         try:
-            response = self.http.post(
-                f"{self.api_url}/auth/register",
+            response = await self.http.post(
+                "/auth/register",
                 json={
                     "email": user.email,
                     "password": user.password,
@@ -249,22 +331,11 @@ class DevSeeder:
             elif response.status_code == 202:
                 # Email confirmation required - user created but no session
                 print(f"   ⚠️  Registered (needs email confirm): {user.email}")
-                # Get user ID from profiles
-                profile = (
-                    self.supabase.table("profiles")
-                    .select("id")
-                    .eq("email", user.email)
-                    .execute()
-                )
-                if profile.data:
-                    user_id = profile.data[0]["id"]
-                    self.user_ids[user.email] = user_id
-                    return user_id
-                return None
+                return await self._get_existing_user_id(user.email)
 
-            elif "already" in response.text.lower():
+            elif response.status_code == 409:
                 print(f"   ℹ️  Already exists: {user.email}")
-                return self._get_existing_user_id(user.email)
+                return await self._get_existing_user_id(user.email)
 
             else:
                 print(f"   ❌ Failed ({response.status_code}): {user.email}")
@@ -275,13 +346,20 @@ class DevSeeder:
             print(f"   ❌ Error: {user.email} - {e}")
             return None
 
-    def _get_existing_user_id(self, email: str) -> str | None:
-        """Get user ID from database if already exists."""
+    async def _get_existing_user_id(self, email: str) -> str | None:
+        """
+        Resolve a user's id: from the prefetched map, else one profiles
+        lookup whose result is remembered for the rest of the run.
+        """
+        if email in self.user_ids:
+            return self.user_ids[email]
+
         try:
             profile = (
-                self.supabase.table("profiles")
+                await self.supabase.table("profiles")
                 .select("id")
                 .eq("email", email)
+                .limit(1)
                 .execute()
             )
             if profile.data:
@@ -292,11 +370,13 @@ class DevSeeder:
             pass
         return None
 
-    def login_user(self, email: str, password: str = DEFAULT_PASSWORD) -> str | None:
+    async def login_user(
+        self, email: str, password: str = DEFAULT_PASSWORD
+    ) -> str | None:
         """Login user via API and get token."""
         try:
-            response = self.http.post(
-                f"{self.api_url}/auth/login",
+            response = await self.http.post(
+                "/auth/login",
                 json={"email": email, "password": password},
             )
 
@@ -315,31 +395,44 @@ class DevSeeder:
 
         return None
 
-    def set_platform_admin(self, user_id: str, email: str) -> None:
-        """Promote user to platform admin (requires direct DB access)."""
+    async def set_platform_admins(self, user_ids: list[str]) -> None:
+        """Promote users to platform admin in one update (direct DB access)."""
+        if not user_ids:
+            return
+
         try:
-            self.supabase.table("profiles").update({"is_platform_admin": True}).eq(
-                "id", user_id
-            ).execute()
-            print("      🌟 Promoted to Platform Admin")
+            await self.supabase.table("profiles").update(
+                {"is_platform_admin": True}
+            ).in_("id", user_ids).execute()
+            print(f"   🌟 Promoted to Platform Admin: {len(user_ids)} user(s)")
 
             # Log this action manually since it's a direct DB change
-            self._log_audit_direct(
-                actor_id=user_id,
-                action="PROMOTE_PLATFORM_ADMIN",
-                category="system",
-                resource="profile",
-                resource_id=user_id,
-                metadata={"email": email, "source": "seed_script"},
+            await self._log_audit_direct(
+                [
+                    self._audit_entry(
+                        actor_id=user_id,
+                        action="PROMOTE_PLATFORM_ADMIN",
+                        category="system",
+                        resource="profile",
+                        resource_id=user_id,
+                        metadata={
+                            "email": self._email_for(user_id),
+                            "source": "seed_script",
+                        },
+                    )
+                    for user_id in user_ids
+                ]
             )
         except Exception as e:
-            print(f"      ⚠️  Could not set admin: {e}")
+            print(f"   ⚠️  Could not set admin: {e}")
 
-    def create_organization(self, org: OrgConfig, admin_token: str) -> str | None:
+    async def create_organization(
+        self, org: OrgConfig, admin_token: str
+    ) -> str | None:
         """Create organization via API (requires platform admin)."""
         try:
-            response = self.http.post(
-                f"{self.api_url}/organizations/",  # Trailing slash required
+            response = await self.http.post(
+                "/organizations/",  # Trailing slash required
                 json={
                     "name": org.name,
                     "slug": org.slug,
@@ -357,25 +450,25 @@ class DevSeeder:
                     print(f"   ✅ Created: {org.name}")
                     return org_id
 
-            elif response.status_code == 409 or "already" in response.text.lower():
+            elif response.status_code == 409:
                 print(f"   ℹ️  Already exists: {org.slug}")
-                return self._get_existing_org_id(org.slug)
+                return await self._get_existing_org_id(org.slug)
 
             else:
                 print(f"   ❌ Failed ({response.status_code}): {org.name}")
                 print(f"      {response.text[:200]}")
                 # Fallback to direct creation
-                return self._create_org_direct(org)
+                return await self._create_org_direct(org)
 
         except Exception as e:
             print(f"   ❌ Error creating {org.name}: {e}")
-            return self._create_org_direct(org)
+            return await self._create_org_direct(org)
 
-    def _create_org_direct(self, org: OrgConfig) -> str | None:
+    async def _create_org_direct(self, org: OrgConfig) -> str | None:
         """Fallback: create org directly in DB."""
         try:
             response = (
-                self.supabase.table("organizations")
+                await self.supabase.table("organizations")
                 .upsert(
                     {
                         "name": org.name,
@@ -398,11 +491,14 @@ class DevSeeder:
             print(f"   ❌ Direct creation failed: {e}")
         return None
 
-    def _get_existing_org_id(self, slug: str) -> str | None:
+    async def _get_existing_org_id(self, slug: str) -> str | None:
         """Get org ID from database."""
+        if slug in self.org_ids:
+            return self.org_ids[slug]
+
         try:
             org = (
-                self.supabase.table("organizations")
+                await self.supabase.table("organizations")
                 .select("id")
                 .eq("slug", slug)
                 .execute()
@@ -415,62 +511,88 @@ class DevSeeder:
             pass
         return None
 
-    def add_membership(
+    async def add_membership(
         self, user_id: str, org_slug: str, role: str, admin_token: str | None = None
-    ) -> None:
-        """Add user to organization with role."""
+    ) -> dict | None:
+        """
+        Add user to organization with role via the API.
+
+        Returns:
+            The membership row still to be written directly to the DB when
+            the API couldn't add it (see `upsert_memberships`), else None
+        """
         org_id = self.org_ids.get(org_slug)
         if not org_id:
-            org_id = self._get_existing_org_id(org_slug)
+            org_id = await self._get_existing_org_id(org_slug)
 
+        email = self._email_for(user_id)
         if not org_id:
-            print(f"      ⚠️  Org not found: {org_slug}")
-            return
+            print(f"   ⚠️  {email}: org not found: {org_slug}")
+            return None
 
         # Try via API first if we have admin token
         if admin_token:
             try:
-                response = self.http.post(
-                    f"{self.api_url}/organizations/{org_id}/members",
+                response = await self.http.post(
+                    f"/organizations/{org_id}/members",
                     json={"user_id": user_id, "role": role},
                     headers={"Authorization": f"Bearer {admin_token}"},
                 )
                 if response.status_code in [200, 201]:
-                    print(f"      🔗 {org_slug} → {role} (via API)")
-                    return
+                    print(f"   🔗 {email}: {org_slug} → {role} (via API)")
+                    return None
                 elif response.status_code == 409:
-                    print(f"      ℹ️  {org_slug} → {role} (ya existe)")
-                    return
+                    print(f"   ℹ️  {email}: {org_slug} → {role} (ya existe)")
+                    return None
             except Exception:
                 pass
 
-        # Fallback to direct DB
+        # Fallback to direct DB (batched by the caller)
+        print(f"   🔗 {email}: {org_slug} → {role}")
+        return {
+            "organization_id": org_id,
+            "user_id": user_id,
+            "role": role,
+            "status": "active",
+        }
+
+    async def upsert_memberships(self, rows: list[dict]) -> None:
+        """Write memberships the API didn't add in a single upsert."""
+        if not rows:
+            return
+
         try:
-            self.supabase.table("organization_members").upsert(
-                {
-                    "organization_id": org_id,
-                    "user_id": user_id,
-                    "role": role,
-                    "status": "active",
-                },
-                on_conflict="organization_id,user_id",
+            await self.supabase.table("organization_members").upsert(
+                rows, on_conflict="organization_id,user_id"
             ).execute()
-            print(f"      🔗 {org_slug} → {role}")
+            print(f"   ✅ {len(rows)} membership(s) written directly")
 
             # Log membership creation
-            self._log_audit_direct(
-                actor_id=user_id,
-                action="JOIN_ORGANIZATION",
-                category="org",
-                organization_id=org_id,
-                resource="membership",
-                resource_id=user_id,
-                metadata={"role": role, "source": "seed_script"},
+            await self._log_audit_direct(
+                [
+                    self._audit_entry(
+                        actor_id=row["user_id"],
+                        action="JOIN_ORGANIZATION",
+                        category="org",
+                        organization_id=row["organization_id"],
+                        resource="membership",
+                        resource_id=row["user_id"],
+                        metadata={"role": row["role"], "source": "seed_script"},
+                    )
+                    for row in rows
+                ]
             )
         except Exception as e:
-            print(f"      ⚠️  Membership failed: {e}")
+            print(f"   ⚠️  Memberships failed: {e}")
+
+    def _email_for(self, user_id: str) -> str | None:
+        """Reverse lookup of a seeded user's email."""
+        for email, known_id in self.user_ids.items():
+            if known_id == user_id:
+                return email
+        return None
 
-    def _log_audit_direct(
+    def _audit_entry(
         self,
         actor_id: str,
         action: str,
@@ -479,57 +601,71 @@ class DevSeeder:
         resource: str | None = None,
         resource_id: str | None = None,
         metadata: dict | None = None,
-    ) -> None:
-        """Insert audit log directly (for operations that bypass API)."""
+    ) -> dict:
+        """Build an audit.logs row for an operation that bypassed the API."""
+        return {
+            "actor_id": actor_id,
+            "actor_email": self._email_for(actor_id),
+            "organization_id": organization_id,
+            "category_code": category,
+            "action": action,
+            "resource": resource,
+            "resource_id": resource_id,
+            "metadata": metadata or {},
+            "ip_address": "127.0.0.1",
+            "user_agent": "OASIS-Seed-Script/1.0",
+        }
+
+    async def _log_audit_direct(self, entries: list[dict]) -> None:
+        """Insert audit logs directly in one request."""
+        if not entries:
+            return
+
         try:
-            actor_email = None
-            profile = (
-                self.supabase.table("profiles")
-                .select("email")
-                .eq("id", actor_id)
+            await (
+                schema_client(self.supabase, "audit")
+                .from_("logs")
+                .insert(entries)
                 .execute()
             )
-            if profile.data:
-                actor_email = profile.data[0].get("email")
-
-            self.supabase.schema("audit").from_("logs").insert(
-                {
-                    "actor_id": actor_id,
-                    "actor_email": actor_email,
-                    "organization_id": organization_id,
-                    "category_code": category,
-                    "action": action,
-                    "resource": resource,
-                    "resource_id": resource_id,
-                    "metadata": metadata or {},
-                    "ip_address": "127.0.0.1",
-                    "user_agent": "OASIS-Seed-Script/1.0",
-                }
-            ).execute()
         except Exception:
             pass  # Silent fail for audit logs
 
-    def seed_all(self) -> None:
+    async def seed_all(self) -> None:
         """Run full seed process."""
+        await self.prefetch_ids()
+
         print("\n" + "=" * 60)
         print("👥 PHASE 1: Register Users via API")
         print("=" * 60)
 
-        # Register all users via API (generates REGISTER logs)
-        for user in DEV_USERS:
-            user_id = self.register_user(user)
-
-            if user_id and user.is_platform_admin:
-                self.set_platform_admin(user_id, user.email)
+        # Register all users via API concurrently (generates REGISTER logs)
+        user_ids = await asyncio.gather(
+            *(self._bounded(self.register_user(user)) for user in DEV_USERS),
+            return_exceptions=True,
+        )
+        await self.set_platform_admins(
+            [
+                user_id
+                for user, user_id in zip(DEV_USERS, user_ids, strict=True)
+                if user.is_platform_admin and isinstance(user_id, str)
+            ]
+        )
 
         print("\n" + "=" * 60)
         print("🔐 PHASE 2: Login Users via API")
         print("=" * 60)
 
-        # Login all users (generates LOGIN logs)
-        for user in DEV_USERS:
-            token = self.login_user(user.email, user.password)
-            if user.is_platform_admin and token:
+        # Login all users concurrently (generates LOGIN logs)
+        tokens = await asyncio.gather(
+            *(
+                self._bounded(self.login_user(user.email, user.password))
+                for user in DEV_USERS
+            ),
+            return_exceptions=True,
+        )
+        for user, token in zip(DEV_USERS, tokens, strict=True):
+            if user.is_platform_admin and isinstance(token, str):
                 self.admin_token = token
 
         print("\n" + "=" * 60)
@@ -537,27 +673,43 @@ class DevSeeder:
         print("=" * 60)
 
         # Create organizations (requires platform admin)
+        new_orgs = [org for org in DEV_ORGANIZATIONS if org.slug not in self.org_ids]
+        for org in DEV_ORGANIZATIONS:
+            if org.slug in self.org_ids:
+                print(f"   ℹ️  Already exists: {org.slug}")
+
         if self.admin_token:
-            for org in DEV_ORGANIZATIONS:
-                self.create_organization(org, self.admin_token)
+            await asyncio.gather(
+                *(
+                    self._bounded(self.create_organization(org, self.admin_token))
+                    for org in new_orgs
+                )
+            )
         else:
             print("   ⚠️  No admin token, creating orgs directly")
-            for org in DEV_ORGANIZATIONS:
-                self._create_org_direct(org)
+            await asyncio.gather(
+                *(self._bounded(self._create_org_direct(org)) for org in new_orgs)
+            )
 
         print("\n" + "=" * 60)
         print("🔗 PHASE 4: Assign Memberships")
         print("=" * 60)
 
-        # Assign memberships
-        for user in DEV_USERS:
-            user_id = self.user_ids.get(user.email)
-            if not user_id:
-                continue
-
-            print(f"   {user.email}:")
-            for org_slug, role in user.memberships:
-                self.add_membership(user_id, org_slug, role, self.admin_token)
+        # Assign memberships via API concurrently; collect the rest for one
+        # direct upsert
+        rows = await asyncio.gather(
+            *(
+                self._bounded(
+                    self.add_membership(
+                        self.user_ids[user.email], org_slug, role, self.admin_token
+                    )
+                )
+                for user in DEV_USERS
+                if user.email in self.user_ids
+                for org_slug, role in user.memberships
+            )
+        )
+        await self.upsert_memberships([row for row in rows if row])
 
     def print_summary(self) -> None:
         """Print seed summary."""
@@ -595,6 +747,27 @@ class DevSeeder:
 # =============================================================================
 
 
+async def run(args: argparse.Namespace, supabase_url: str, key: str) -> None:
+    async with DevSeeder(args.api_url, supabase_url, key) as seeder:
+        # Check API is running
+        if not await seeder.check_api_health():
+            print("\n❌ API is not running!")
+            print("   Start it with: uvicorn services.auth_service.main:app --reload")
+            print("   Then run this script again.")
+            sys.exit(1)
+
+        print("   ✅ API is healthy")
+
+        if not seeder.check_environment():
+            sys.exit(1)
+
+        if args.clean:
+            await seeder.clean_data()
+
+        await seeder.seed_all()
+        seeder.print_summary()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Seed OASIS development data via API")
     parser.add_argument(
@@ -603,38 +776,11 @@ def main():
     parser.add_argument("--api-url", default=DEFAULT_API_URL, help="API base URL")
     args = parser.parse_args()
 
-    load_dotenv()
-
-    supabase_url = os.getenv("SUPABASE_URL")
-    service_role_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-
-    if not supabase_url or not service_role_key:
-        print("❌ Missing SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY in .env")
-        sys.exit(1)
-
     print("🚀 OASIS Development Seeder (API Mode)")
     print(f"   API: {args.api_url}")
-    print(f"   Supabase: {supabase_url}")
-
-    seeder = DevSeeder(args.api_url, supabase_url, service_role_key)
-
-    # Check API is running
-    if not seeder.check_api_health():
-        print("\n❌ API is not running!")
-        print("   Start it with: uvicorn services.auth_service.main:app --reload")
-        print("   Then run this script again.")
-        sys.exit(1)
-
-    print("   ✅ API is healthy")
-
-    if not seeder.check_environment():
-        sys.exit(1)
-
-    if args.clean:
-        seeder.clean_data()
+    print(f"   Supabase: {settings.SUPABASE_URL}")
 
-    seeder.seed_all()
-    seeder.print_summary()
+    asyncio.run(run(args, settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY))
 
 
 if __name__ == "__main__":
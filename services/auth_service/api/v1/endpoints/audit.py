@@ -10,15 +10,15 @@ Read-only endpoints for viewing audit logs:
 from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from common.auth.security import (
     OrgRoleChecker,
     PlatformAdminRequired,
     get_current_user,
+    get_user_scoped_client,
 )
-from common.database.client import get_admin_client, get_supabase_client
+from common.database.client import UserScopedClient, get_admin_client
 from services.auth_service.crud import (
     AuditOperationError,
     get_audit_categories,
@@ -32,7 +32,6 @@ from services.auth_service.schemas.audit import (
 )
 
 router = APIRouter()
-security = HTTPBearer()
 
 
 # =============================================================================
@@ -65,13 +64,19 @@ async def list_all_logs(
     ] = None,
     # Corrección B008 aquí:
     end_date: Annotated[datetime | None, Query(description="End date filter")] = None,
+    cursor: Annotated[
+        str | None, Query(description="next_cursor from the previous page")
+    ] = None,
+    exact_count: Annotated[
+        bool, Query(description="Exact total instead of an estimate")
+    ] = False,
 ):
     """
     Lista todos los logs de auditoría.
     Solo accesible por Platform Admins.
     """
     try:
-        logs, total = await list_audit_logs(
+        logs, total, next_cursor = await list_audit_logs(
             db=db,
             skip=skip,
             limit=limit,
@@ -81,6 +86,8 @@ async def list_all_logs(
             action=action,
             start_date=start_date,
             end_date=end_date,
+            cursor=cursor,
+            exact_count=exact_count,
         )
 
         return {
@@ -88,8 +95,11 @@ async def list_all_logs(
             "total": total,
             "skip": skip,
             "limit": limit,
+            "next_cursor": next_cursor,
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except AuditOperationError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -107,9 +117,8 @@ async def list_all_logs(
 )
 async def get_org_logs(
     ctx: Annotated[dict, Depends(OrgRoleChecker(["owner", "admin"]))],
-    db: Annotated[Any, Depends(get_supabase_client)],
+    db: Annotated[UserScopedClient, Depends(get_user_scoped_client)],
     admin_db: Annotated[Any, Depends(get_admin_client)],
-    token: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=500)] = 100,
     user_id: Annotated[str | None, Query(description="Filter by user")] = None,
@@ -119,6 +128,12 @@ async def get_org_logs(
     start_date: Annotated[datetime | None, Query()] = None,
     # Corrección B008 aquí:
     end_date: Annotated[datetime | None, Query()] = None,
+    cursor: Annotated[
+        str | None, Query(description="next_cursor from the previous page")
+    ] = None,
+    exact_count: Annotated[
+        bool, Query(description="Exact total instead of an estimate")
+    ] = False,
 ):
     """
     Lista los logs de auditoría de la organización actual.
@@ -137,7 +152,7 @@ async def get_org_logs(
     try:
         if is_platform_admin:
             # Platform Admin usa admin_db
-            logs, total = await list_audit_logs(
+            logs, total, next_cursor = await list_audit_logs(
                 db=admin_db,
                 skip=skip,
                 limit=limit,
@@ -147,12 +162,12 @@ async def get_org_logs(
                 action=action,
                 start_date=start_date,
                 end_date=end_date,
+                cursor=cursor,
+                exact_count=exact_count,
             )
         else:
             # Org Admin: RLS filtra automáticamente
-            db.postgrest.auth(token.credentials)
-
-            logs, total = await list_audit_logs(
+            logs, total, next_cursor = await list_audit_logs(
                 db=db,
                 skip=skip,
                 limit=limit,
@@ -162,6 +177,8 @@ async def get_org_logs(
                 action=action,
                 start_date=start_date,
                 end_date=end_date,
+                cursor=cursor,
+                exact_count=exact_count,
             )
 
         return {
@@ -169,8 +186,11 @@ async def get_org_logs(
             "total": total,
             "skip": skip,
             "limit": limit,
+            "next_cursor": next_cursor,
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except AuditOperationError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -188,16 +208,13 @@ async def get_org_logs(
 )
 async def get_my_activity(
     current_user: Annotated[dict, Depends(get_current_user)],
-    db: Annotated[Any, Depends(get_supabase_client)],
-    token: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: Annotated[UserScopedClient, Depends(get_user_scoped_client)],
     days: Annotated[int, Query(ge=1, le=365, description="Days to look back")] = 30,
     limit: Annotated[int, Query(ge=1, le=200, description="Max records")] = 50,
 ):
     """
     Obtiene tu propia actividad reciente.
     """
-    db.postgrest.auth(token.credentials)
-
     try:
         activity = await get_user_activity(
             db=db,
@@ -224,17 +241,17 @@ async def get_my_activity(
     description="Get all available audit log categories.",
 )
 async def list_categories(
+    response: Response,
     current_user: Annotated[dict, Depends(get_current_user)],
-    db: Annotated[Any, Depends(get_supabase_client)],
-    token: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: Annotated[UserScopedClient, Depends(get_user_scoped_client)],
 ):
     """
     Lista todas las categorías de auditoría disponibles.
     """
-    db.postgrest.auth(token.credentials)
-
     try:
         categories = await get_audit_categories(db=db)
+        # Reference data: let the browser reuse it (private, since authed)
+        response.headers["Cache-Control"] = "private, max-age=300"
         return categories
 
     except AuditOperationError as e:
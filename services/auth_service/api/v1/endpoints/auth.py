@@ -9,12 +9,19 @@ Handles:
 - Password management
 - Current user context (/me)
 """
-from typing import Any
-
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-
-from common.auth.security import get_current_user
+import asyncio
+import logging
+from typing import Any, NamedTuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.security import HTTPAuthorizationCredentials
+
+from common.auth.security import (
+    get_current_user,
+    get_user_scoped_client,
+    invalidate_token,
+    security,
+)
 from common.database.client import get_admin_client, get_supabase_client
 from common.middleware import limit_auth
 from common.schemas.logs import LogCategory
@@ -28,9 +35,56 @@ from services.auth_service.schemas.auth import (
     UserRegister,
     UserResponse,
 )
+from supabase import AuthApiError
 
 router = APIRouter()
-security = HTTPBearer()
+
+# Profile + active memberships for /me, fetched in one embedded select
+_PROFILE_COLS = (
+    "id,email,full_name,avatar_url,is_platform_admin,metadata,created_at,updated_at"
+)
+_MEMBERSHIP_COLS = (
+    "role,status,joined_at,organizations(id,name,slug,type,settings,created_at)"
+)
+_ME_SELECT = (
+    f"{_PROFILE_COLS},"
+    f"memberships:organization_members!user_id({_MEMBERSHIP_COLS})"
+)
+
+
+def _user_brief(user: Any) -> dict[str, Any]:
+    """
+    Pick the AuthUserBrief fields from a Supabase Auth user.
+
+    Avoids dumping the full user (identities, factors, metadata) only for
+    the response model to discard most of it.
+    """
+    return {
+        "id": user.id,
+        "email": user.email,
+        "aud": getattr(user, "aud", "authenticated"),
+        "created_at": getattr(user, "created_at", None),
+    }
+
+
+class _RequestContext(NamedTuple):
+    """Client data recorded with each audited auth action."""
+
+    ip_address: str | None
+    user_agent: str | None
+
+
+async def _request_context(request: Request) -> _RequestContext:
+    """
+    Read client IP and User-Agent once per request.
+
+    FastAPI caches dependency results per request, so every consumer
+    shares the same values instead of re-parsing headers.
+    """
+    return _RequestContext(
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
+    )
 
 
 # ============================================================================
@@ -44,12 +98,16 @@ security = HTTPBearer()
     status_code=status.HTTP_201_CREATED,
     summary="Register new user",
     description="Create a new user account and return authentication tokens.",
-    responses={429: {"description": "Rate limit excedido"}},
+    responses={
+        409: {"description": "Email ya registrado"},
+        429: {"description": "Rate limit excedido"},
+    },
 )
 @limit_auth("10/minute")  # Strict limit to prevent mass registration
 async def register(
     request: Request,
     user_in: UserRegister,
+    ctx: _RequestContext = Depends(_request_context),  # noqa: B008
     db=Depends(get_supabase_client),  # noqa: B008
     admin_db=Depends(get_admin_client),  # noqa: B008
 ) -> Any:
@@ -80,10 +138,11 @@ async def register(
         await log_user_action(
             db=admin_db,
             user_id=auth_response.user.id,
+            actor_email=auth_response.user.email,
             action="REGISTER",
             category=LogCategory.AUTH,
-            ip_address=request.client.host if request.client else None,
-            user_agent=request.headers.get("user-agent"),
+            ip_address=ctx.ip_address,
+            user_agent=ctx.user_agent,
             metadata={"provider": "email", "full_name": user_in.full_name},
         )
 
@@ -92,11 +151,18 @@ async def register(
             "refresh_token": auth_response.session.refresh_token,
             "expires_in": auth_response.session.expires_in,
             "token_type": "bearer",
-            "user": auth_response.user.model_dump(),
+            "user": _user_brief(auth_response.user),
         }
 
     except HTTPException:
         raise
+    except AuthApiError as e:
+        if e.code in ("user_already_exists", "email_exists"):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User already registered",
+            ) from e
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -119,6 +185,7 @@ async def register(
 async def login(
     request: Request,
     credentials: LoginCredentials,
+    ctx: _RequestContext = Depends(_request_context),  # noqa: B008
     db=Depends(get_supabase_client),  # noqa: B008
     admin_db=Depends(get_admin_client),  # noqa: B008
 ) -> Any:
@@ -150,10 +217,11 @@ async def login(
     await log_user_action(
         db=admin_db,
         user_id=user.id,
+        actor_email=user.email,
         action="LOGIN",
         category=LogCategory.AUTH,
-        ip_address=request.client.host if request.client else None,
-        user_agent=request.headers.get("user-agent"),
+        ip_address=ctx.ip_address,
+        user_agent=ctx.user_agent,
     )
 
     return {
@@ -161,11 +229,7 @@ async def login(
         "refresh_token": session.refresh_token,
         "expires_in": session.expires_in,
         "token_type": "bearer",
-        "user": {
-            "id": user.id,
-            "email": user.email,
-            "aud": getattr(user, "aud", "authenticated"),
-        },
+        "user": _user_brief(user),
     }
 
 
@@ -202,7 +266,7 @@ async def refresh_session(
             "refresh_token": session.refresh_token,
             "expires_in": session.expires_in,
             "token_type": "bearer",
-            "user": res.user.model_dump(),
+            "user": _user_brief(res.user),
         }
     except HTTPException:
         raise
@@ -217,6 +281,18 @@ async def refresh_session(
 # Logout
 # ============================================================================
 
+# Strong references to in-flight background revocations; the event loop only
+# keeps weak ones, so an unreferenced task could be collected mid-flight
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def _revoke_session(admin_db: Any, access_token: str) -> None:
+    """Revoke the token's sessions in GoTrue, logging instead of raising."""
+    try:
+        await admin_db.auth.admin.sign_out(access_token)
+    except Exception as e:
+        logging.warning(f"Background sign_out failed: {e}")
+
 
 @router.post(
     "/logout",
@@ -225,28 +301,42 @@ async def refresh_session(
     description="Invalidate the current session.",
 )
 async def logout(
-    request: Request,
+    ctx: _RequestContext = Depends(_request_context),  # noqa: B008
     current_user: dict = Depends(get_current_user),  # noqa: B008
-    db=Depends(get_supabase_client),  # noqa: B008
     admin_db=Depends(get_admin_client),  # noqa: B008
     token: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
+    sync: bool = Query(  # noqa: B008
+        False, description="Esperar la revocación en Supabase Auth antes de responder"
+    ),
 ) -> None:
     """
     Cierra la sesión actual.
+
+    Registra el logout y revoca las sesiones del usuario con su JWT (GoTrue
+    admin sign_out). Por defecto la revocación corre en segundo plano y sus
+    errores solo se registran en el log, así que el refresh token puede
+    seguir válido unos instantes tras el 204. Con `sync=true` se espera la
+    revocación y sus errores se propagan. En ambos casos el token se
+    descarta de la caché de validación.
     """
-    # Log the logout
     await log_user_action(
         db=admin_db,
         user_id=current_user["id"],
+        actor_email=current_user["email"],
         action="LOGOUT",
         category=LogCategory.AUTH,
-        ip_address=request.client.host if request.client else None,
-        user_agent=request.headers.get("user-agent"),
+        ip_address=ctx.ip_address,
+        user_agent=ctx.user_agent,
     )
+    invalidate_token(token.credentials)
 
-    # Configurar contexto de usuario para sign_out
-    db.postgrest.auth(token.credentials)
-    await db.auth.sign_out()
+    if sync:
+        await admin_db.auth.admin.sign_out(token.credentials)
+        return None
+
+    task = asyncio.create_task(_revoke_session(admin_db, token.credentials))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
     return None
 
 
@@ -263,8 +353,7 @@ async def logout(
 )
 async def read_users_me(
     current_user: dict = Depends(get_current_user),  # noqa: B008
-    db=Depends(get_supabase_client),  # noqa: B008
-    token: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
+    db=Depends(get_user_scoped_client),  # noqa: B008
 ) -> Any:
     """
     Obtiene el perfil completo del usuario actual incluyendo sus membresías.
@@ -276,22 +365,20 @@ async def read_users_me(
 
     Defensa en profundidad:
     - Backend verifica identidad via get_current_user
-    - RLS verifica que solo accede a sus propios datos
+    - RLS verifica que solo accede a sus propios datos (db va con el JWT
+      del usuario)
     """
-    # Configurar RLS con el contexto del usuario
-    db.postgrest.auth(token.credentials)
-
     user_id = current_user["id"]
 
     try:
-        # Query de perfil - RLS asegura que solo veo mi perfil
+        # Perfil + membresías activas en un solo request (embed de PostgREST;
+        # `!user_id` desambigua la FK, invited_by también apunta a profiles).
+        # RLS asegura que solo veo lo mío
         profile_res = (
             await db.table("profiles")
-            .select(
-                "id, email, full_name, avatar_url, is_platform_admin,"
-                "metadata, created_at, updated_at"
-            )
+            .select(_ME_SELECT)
             .eq("id", user_id)
+            .eq("memberships.status", "active")
             .single()
             .execute()
         )
@@ -299,32 +386,21 @@ async def read_users_me(
         if not profile_res.data:
             raise HTTPException(status_code=404, detail="Profile not found")
 
-        # Query de membresías - RLS asegura que solo veo mis membresías
-        memberships_res = (
-            await db.table("organization_members")
-            .select(
-                "role, status, joined_at, "
-                "organizations(id, name, slug, type, settings, created_at)"
-            )
-            .eq("user_id", user_id)
-            .eq("status", "active")
-            .execute()
-        )
+        profile = profile_res.data
 
         # Formatear membresías
-        formatted_memberships = []
-        for m in memberships_res.data or []:
-            if m.get("organizations"):
-                formatted_memberships.append(
-                    {
-                        "role": m["role"],
-                        "status": m["status"],
-                        "joined_at": m["joined_at"],
-                        "organization": m["organizations"],
-                    }
-                )
-
-        return {**profile_res.data, "memberships": formatted_memberships}
+        formatted_memberships = [
+            {
+                "role": m["role"],
+                "status": m["status"],
+                "joined_at": m["joined_at"],
+                "organization": org,
+            }
+            for m in profile.pop("memberships", None) or []
+            if (org := m.get("organizations"))
+        ]
+
+        return {**profile, "memberships": formatted_memberships}
 
     except HTTPException:
         raise
@@ -403,6 +479,7 @@ async def update_password(
         await log_user_action(
             db=admin_db,
             user_id=user_id,
+            actor_email=user_response.user.email,
             action="PASSWORD_CHANGE",
             category=LogCategory.AUTH,
             metadata={"method": "manual_update"},
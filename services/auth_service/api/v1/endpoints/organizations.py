@@ -1,9 +1,10 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 # 1. Imports de Common (Rutas Absolutas como en tus archivos)
-from common.auth.security import get_current_user
-from common.database.client import get_admin_client, get_supabase_client
+from common.auth.security import get_current_user, get_user_scoped_client
+from common.database.client import get_admin_client, returning
 
 # 2. Imports de Schemas (Asumiendo que creaste el archivo organizations.py en schemas)
 from services.auth_service.schemas.organizations import (
@@ -12,9 +13,31 @@ from services.auth_service.schemas.organizations import (
     OrganizationCreate,
     OrganizationOut,
 )
+from supabase import PostgrestAPIError
 
 router = APIRouter()
-security = HTTPBearer()
+
+
+async def _requester_role(current_user: dict, org_id: str, db) -> str | None:
+    """
+    Rol activo del solicitante en la organización.
+
+    Siempre se consulta organization_members (db con RLS): el claim
+    `org_roles` del JWT puede estar desactualizado tras una degradación o
+    expulsión y no sirve para autorizar escrituras.
+    """
+    perms = (
+        await db.table("organization_members")
+        .select("role")
+        .eq("organization_id", org_id)
+        .eq("user_id", current_user["id"])
+        .eq("status", "active")
+        .limit(1)
+        .execute()
+    )
+    return perms.data[0]["role"] if perms.data else None
+
+
 # --- ENDPOINTS ---
 
 
@@ -25,53 +48,44 @@ async def create_organization(
     # Usamos admin_db para escribir saltándonos las reglas RLS
     admin_db=Depends(get_admin_client),  # noqa: B008
 ):
-    user_id = current_user["id"]
-
-    # 1. Crear Organización (Usando permisos de Super Admin)
+    # Organización + membresía owner en una sola transacción (RPC)
     try:
-        org_res = (
-            await admin_db.table("organizations")
-            .insert(
-                {
-                    "name": org_in.name,
-                    "slug": org_in.slug,
-                    "type": org_in.type,
-                    "settings": org_in.settings,
-                }
-            )
-            .execute()
-        )
+        org_res = await admin_db.rpc(
+            "create_org_with_owner",
+            {
+                "p_name": org_in.name,
+                "p_slug": org_in.slug,
+                "p_type": org_in.type,
+                "p_settings": org_in.settings,
+                "p_owner": current_user["id"],
+            },
+        ).execute()
+    except PostgrestAPIError as e:
+        if e.code == "23505":  # unique_violation on slug
+            raise HTTPException(
+                status_code=409,
+                detail="Ya existe una organización con ese slug",
+            ) from e
+        raise HTTPException(
+            status_code=400,
+            detail="Error creando organización. ¿Quizás el slug ya existe?",
+        ) from e
     except Exception as e:
         raise HTTPException(
             status_code=400,
             detail="Error creando organización. ¿Quizás el slug ya existe?",
         ) from e
 
-    new_org = org_res.data[0]
-
-    # 2. Asignar Owner (Usando permisos de Super Admin)
-    # Esto es seguro porque lo hace el Backend, no el usuario.
-    member_data = {
-        "organization_id": new_org["id"],
-        "user_id": user_id,
-        "role": "owner",
-        "status": "active",
-    }
-
-    await admin_db.table("organization_members").insert(member_data).execute()
-
-    return new_org
+    return org_res.data
 
 
 @router.get("/mine", response_model=list[OrganizationOut])
 async def get_my_organizations(
     current_user: dict = Depends(get_current_user),  # noqa: B008
-    db=Depends(get_supabase_client),  # noqa: B008
-    token: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
+    db=Depends(get_user_scoped_client),  # noqa: B008
 ):
 
     user_id = current_user["id"]
-    db.postgrest.auth(token.credentials)
 
     # Traer organizaciones donde soy miembro activo
     res = (
@@ -83,7 +97,7 @@ async def get_my_organizations(
     )
 
     # Extraer el objeto anidado
-    orgs = [item["organizations"] for item in res.data if item.get("organizations")]
+    orgs = [org for item in res.data if (org := item.get("organizations"))]
     return orgs
 
 
@@ -92,132 +106,70 @@ async def add_member_to_org(
     org_id: str,
     member_in: MemberAdd,
     current_user: dict = Depends(get_current_user),  # noqa: B008
-    db=Depends(get_supabase_client),  # noqa: B008
-    token: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
+    db=Depends(get_user_scoped_client),  # noqa: B008
     admin_db=Depends(get_admin_client),  # noqa: B008
 ):
-    # 1. Autenticar contexto del solicitante
-    db.postgrest.auth(token.credentials)
-    requester_id = current_user["id"]
+    # 1. Permisos (claim del JWT o db con RLS) y usuario destino (ADMIN_DB)
+    # son independientes, así que se consultan en paralelo.
+    # Soporta búsqueda por email O por user_id
+    if member_in.user_id:
+        target_query = admin_db.table("profiles").select("id").eq(
+            "id", member_in.user_id
+        )
+    else:
+        target_query = admin_db.table("profiles").select("id").eq(
+            "email", member_in.email
+        )
 
-    # 2. Verificar Permisos (Usamos 'db' con RLS)
-    perms = (
-        await db.table("organization_members")
-        .select("role")
-        .eq("organization_id", org_id)
-        .eq("user_id", requester_id)
-        .single()
-        .execute()
+    requester_role, target_user_res = await asyncio.gather(
+        _requester_role(current_user, org_id, db),
+        target_query.limit(1).execute(),
     )
 
-    if not perms.data or perms.data["role"] not in ["owner", "admin"]:
+    if requester_role not in ["owner", "admin"]:
         raise HTTPException(
             status_code=403, detail="No tienes permisos para invitar miembros"
         )
 
-    # 3. Buscar usuario destino (Usando ADMIN_DB)
-    # Soporta búsqueda por email O por user_id
-    target_user_id = None
-
-    if member_in.user_id:
-        # --- ESCENARIO A: Búsqueda por user_id ---
-        target_user_res = (
-            await admin_db.table("profiles")
-            .select("id")
-            .eq("id", member_in.user_id)
-            .limit(1)
-            .execute()
-        )
-        if target_user_res.data:
-            target_user_id = target_user_res.data[0]["id"]
-        else:
+    if not target_user_res.data:
+        if member_in.user_id:
             raise HTTPException(
                 status_code=404,
                 detail="Usuario no encontrado con el ID proporcionado.",
             )
-
-    elif member_in.email:
-        # --- ESCENARIO B: Búsqueda por email ---
-        target_user_res = (
-            await admin_db.table("profiles")
-            .select("id")
-            .eq("email", member_in.email)
-            .limit(1)
-            .execute()
-        )
-
-        if target_user_res.data:
-            # Usuario existe - obtener su ID
-            target_user_id = target_user_res.data[0]["id"]
-        else:
-            # Usuario NO existe - TODO: Implementar invitaciones pendientes
-            # Por ahora retornamos error indicando que se podría invitar
-            raise HTTPException(
-                status_code=404,
-                detail=(
-                    "Usuario no registrado en la plataforma."
-                    "(Invitaciones pendientes por implementar)"
-                ),
-            )
-
-    # Verificar si ya es miembro
-    # Usamos count='exact', head=True para verificar existencia eficientemente
-    existing_member = (
-        await admin_db.table("organization_members")
-        .select("id", count="exact", head=True)
-        .eq("organization_id", org_id)
-        .eq("user_id", target_user_id)
-        .execute()
-    )
-
-    if existing_member.count > 0:
+        # Usuario NO existe - TODO: Implementar invitaciones pendientes
+        # Por ahora retornamos error indicando que se podría invitar
         raise HTTPException(
-            status_code=409, detail="El usuario ya pertenece a esta organización"
+            status_code=404,
+            detail=(
+                "Usuario no registrado en la plataforma."
+                "(Invitaciones pendientes por implementar)"
+            ),
         )
 
-    # Insertar Membresía (Usando ADMIN_DB)
-    new_member_data = {
-        "organization_id": org_id,
-        "user_id": target_user_id,
-        "role": member_in.role,
-        "status": "active",
-    }
+    target_user_id = target_user_res.data[0]["id"]
 
+    # 2. Insertar Membresía y retornarla con su organización (una sola RPC)
     try:
-        res = (
-            await admin_db.table("organization_members")
-            .insert(new_member_data)
-            .execute()
-        )
+        res = await admin_db.rpc(
+            "add_org_member",
+            {"p_org": org_id, "p_user": target_user_id, "p_role": member_in.role},
+        ).execute()
+    except PostgrestAPIError as e:
+        if e.code == "23505":  # unique_violation: ya es miembro
+            raise HTTPException(
+                status_code=409, detail="El usuario ya pertenece a esta organización"
+            ) from e
+        raise HTTPException(status_code=400, detail="Error al agregar miembro") from e
     except Exception as e:
         raise HTTPException(status_code=400, detail="Error al agregar miembro") from e
 
-    # 5. Retornar respuesta completa
-    query = (
-        "role, status, joined_at, "
-        "organizations(id, name, slug, type, settings, created_at)"
-    )
-
-    full_member = (
-        await admin_db.table("organization_members")
-        .select(query)
-        .eq("id", res.data[0]["id"])
-        .single()
-        .execute()
-    )
-
-    org_data = full_member.data.get("organizations")
-    if not org_data:
+    if not res.data or not res.data.get("organization"):
         raise HTTPException(
             status_code=500, detail="Error de integridad: Organización no encontrada"
         )
 
-    return {
-        "role": full_member.data["role"],
-        "status": full_member.data["status"],
-        "joined_at": full_member.data["joined_at"],
-        "organization": org_data,
-    }
+    return res.data
 
 
 @router.patch("/{org_id}/members/{user_id}", response_model=MembershipOut)
@@ -226,55 +178,33 @@ async def update_member_role(
     user_id: str,
     member_in: MemberAdd,  # Reutilizamos para el campo 'role'
     current_user: dict = Depends(get_current_user),  # noqa: B008
-    db=Depends(get_supabase_client),  # noqa: B008
-    token: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
+    db=Depends(get_user_scoped_client),  # noqa: B008
     admin_db=Depends(get_admin_client),  # noqa: B008
 ):
     """Actualiza el rol de un usuario dentro de una organización específica."""
-    db.postgrest.auth(token.credentials)
-    requester_id = current_user["id"]
-
     # 1. Verificar que el que pide sea Owner/Admin de esa Org
-    perms = (
-        await db.table("organization_members")
-        .select("role")
-        .eq("organization_id", org_id)
-        .eq("user_id", requester_id)
-        .single()
-        .execute()
-    )
-
-    if not perms.data or perms.data["role"] not in ["owner", "admin"]:
+    if await _requester_role(current_user, org_id, db) not in ["owner", "admin"]:
         raise HTTPException(status_code=403, detail="No tienes permisos suficientes")
 
-    # 2. Actualizar el rol (Usando admin_db por RLS)
-    update_res = (
-        await admin_db.table("organization_members")
+    # 2. Actualizar el rol (Usando admin_db por RLS) y retornar el objeto
+    # completo en la misma respuesta
+    update_res = await returning(
+        admin_db.table("organization_members")
         .update({"role": member_in.role})
         .eq("organization_id", org_id)
-        .eq("user_id", user_id)
-        .execute()
-    )
+        .eq("user_id", user_id),
+        "user_id, role, status, joined_at, "
+        "organizations(id, name, slug, type, settings, created_at)",
+    ).execute()
 
     if not update_res.data:
         raise HTTPException(status_code=404, detail="Membresía no encontrada")
 
-    # 3. Retornar objeto completo
-    query = (
-        "role, status, joined_at, "
-        "organizations(id, name, slug, type, settings, created_at)"
-    )
-    full_member = (
-        await admin_db.table("organization_members")
-        .select(query)
-        .eq("id", update_res.data[0]["id"])
-        .single()
-        .execute()
-    )
-
+    member = update_res.data[0]
     return {
-        "role": full_member.data["role"],
-        "status": full_member.data["status"],
-        "joined_at": full_member.data["joined_at"],
-        "organization": full_member.data["organizations"],
+        "user_id": member["user_id"],
+        "role": member["role"],
+        "status": member["status"],
+        "joined_at": member["joined_at"],
+        "organization": member["organizations"],
     }
@@ -12,21 +12,24 @@ Security: Defense in depth
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from common.auth.security import (
     OrgRoleChecker,
     PlatformAdminRequired,
     can_manage_role,
     get_current_user,
+    get_user_scoped_client,
+    invalidate_profile_cache,
 )
-from common.database.client import get_admin_client, get_supabase_client
+from common.database.client import get_admin_client
 from services.auth_service.crud import (
+    MembershipOperationError,
     ProfileNotFoundError,
     ProfileOperationError,
     delete_user_completely,
     get_membership,
+    get_profiles_etag,
     get_user_with_memberships,
     list_all_profiles,
     list_organization_members,
@@ -41,7 +44,12 @@ from services.auth_service.schemas.users import (
 )
 
 router = APIRouter()
-security = HTTPBearer()
+
+
+def _if_none_match(request: Request) -> set[str]:
+    """ETags listed in the request's If-None-Match header."""
+    header = request.headers.get("if-none-match")
+    return {tag.strip() for tag in header.split(",")} if header else set()
 
 
 # ============================================================================
@@ -56,6 +64,8 @@ security = HTTPBearer()
     description="List all users in the platform. Platform Admin only.",
 )
 async def list_all_users(
+    request: Request,
+    response: Response,
     admin: dict = Depends(PlatformAdminRequired()),  # noqa: B008
     db=Depends(get_admin_client),  # noqa: B008
     skip: int = Query(0, ge=0, description="Number of records to skip"),  # noqa: B008
@@ -69,8 +79,18 @@ async def list_all_users(
     """
     Lista todos los usuarios de la plataforma.
     Solo accesible por Platform Admins - usa admin_db (bypass RLS).
+
+    Responde con un ETag calculado sobre `profiles` (conteo y último
+    `updated_at`); si el cliente envía el mismo valor en If-None-Match se
+    retorna 304 sin consultar la página.
     """
     try:
+        etag = f'W/"profiles-{await get_profiles_etag(db)}"'
+        if etag in _if_none_match(request):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
         users, total = await list_all_profiles(
             db=db,
             skip=skip,
@@ -78,6 +98,8 @@ async def list_all_users(
             search=search,
         )
 
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
         return {
             "items": users,
             "total": total,
@@ -150,6 +172,7 @@ async def update_platform_admin_status(
             user_id=user_id,
             is_admin=update_data.is_platform_admin,
         )
+        invalidate_profile_cache(user_id)
         return updated_user
 
     except ProfileNotFoundError as e:
@@ -187,6 +210,7 @@ async def delete_user_global(
 
     try:
         await delete_user_completely(db=db, user_id=user_id)
+        invalidate_profile_cache(user_id)
         return None
 
     except ProfileNotFoundError as e:
@@ -210,9 +234,8 @@ async def list_org_members(
     ctx: Annotated[
         dict, Depends(OrgRoleChecker(["owner", "admin", "facilitador"]))  # noqa: B008
     ],  # noqa: B008
-    db=Depends(get_supabase_client),  # noqa: B008
+    db=Depends(get_user_scoped_client),  # noqa: B008
     admin_db=Depends(get_admin_client),  # noqa: B008
-    token: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
     skip: int = Query(0, ge=0),  # noqa: B008
     limit: int = Query(100, ge=1, le=500),  # noqa: B008
     role: str | None = Query(None, description="Filter by role"),  # noqa: B008
@@ -239,72 +262,18 @@ async def list_org_members(
             detail="Organization context required. Provide X-Organization-ID header.",
         )
 
-    if is_platform_admin:
-        # Platform Admin usa admin_db
-        members, total = await list_organization_members(
-            db=admin_db,
+    # Platform Admin usa admin_db; usuario normal: RLS como segunda capa
+    try:
+        items, total = await list_organization_members(
+            db=admin_db if is_platform_admin else db,
             org_id=org_id,
             status=status_filter,
             role=role,
             skip=skip,
             limit=limit,
         )
-    else:
-        # Usuario normal: RLS como segunda capa
-        db.postgrest.auth(token.credentials)
-
-        try:
-            query = (
-                db.table("organization_members")
-                .select(
-                    "id, role, status, joined_at, user_id, "
-                    "profiles(id, email, full_name, avatar_url)",
-                    count="exact",
-                )
-                .eq("organization_id", org_id)
-            )
-
-            if status_filter:
-                query = query.eq("status", status_filter)
-            if role:
-                query = query.eq("role", role)
-
-            response = (
-                await query.order("joined_at", desc=True)
-                .range(skip, skip + limit - 1)
-                .execute()
-            )
-
-            members = []
-            for m in response.data or []:
-                members.append(
-                    {
-                        "id": m["id"],
-                        "user_id": m["user_id"],
-                        "role": m["role"],
-                        "status": m["status"],
-                        "joined_at": m["joined_at"],
-                        "user": m.get("profiles"),
-                    }
-                )
-
-            total = response.count or 0
-
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-    # Flatten for response
-    items = []
-    for m in members:
-        user_data = m.get("user") or {}
-        items.append(
-            {
-                **user_data,
-                "org_role": m["role"],
-                "membership_status": m["status"],
-                "joined_at": m["joined_at"],
-            }
-        )
+    except MembershipOperationError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
     return {
         "items": items,
@@ -325,9 +294,8 @@ async def list_org_members(
 async def remove_org_member(
     user_id: str,
     ctx: dict = Depends(OrgRoleChecker(["owner", "admin"])),  # noqa: B008
-    db=Depends(get_supabase_client),  # noqa: B008
+    db=Depends(get_user_scoped_client),  # noqa: B008
     admin_db=Depends(get_admin_client),  # noqa: B008
-    token: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
 ):
     """
     Remueve a un usuario de la organización actual.
@@ -374,8 +342,6 @@ async def remove_org_member(
             await remove_member(db=admin_db, org_id=org_id, user_id=user_id)
         else:
             # RLS como segunda capa
-            db.postgrest.auth(token.credentials)
-
             response = (
                 await db.table("organization_members")
                 .delete()
@@ -409,8 +375,7 @@ async def remove_org_member(
 )
 async def get_my_organizations(
     current_user: dict = Depends(get_current_user),  # noqa: B008
-    db=Depends(get_supabase_client),  # noqa: B008
-    token: HTTPAuthorizationCredentials = Depends(security),  # noqa: B008
+    db=Depends(get_user_scoped_client),  # noqa: B008
 ):
     """
     Obtiene las organizaciones donde el usuario actual es miembro.
@@ -420,8 +385,6 @@ async def get_my_organizations(
     - RLS verifica acceso
     """
     # RLS como segunda capa
-    db.postgrest.auth(token.credentials)
-
     try:
         response = (
             await db.table("organization_members")
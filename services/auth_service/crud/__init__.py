@@ -10,6 +10,8 @@ from services.auth_service.crud.audit import (
     get_user_activity,
     list_audit_logs,
     log_user_action,
+    start_audit_writer,
+    stop_audit_writer,
 )
 from services.auth_service.crud.organizations import (
     MembershipExistsError,
@@ -39,6 +41,7 @@ from services.auth_service.crud.profiles import (
     delete_user_completely,
     get_profile_by_email,
     get_profile_by_id,
+    get_profiles_etag,
     get_user_with_memberships,
     list_all_profiles,
     set_platform_admin_status,
@@ -51,6 +54,7 @@ __all__ = [
     "ProfileOperationError",
     "get_profile_by_id",
     "get_profile_by_email",
+    "get_profiles_etag",
     "list_all_profiles",
     "update_profile",
     "set_platform_admin_status",
@@ -85,4 +89,6 @@ __all__ = [
     "get_user_activity",
     "get_organization_activity",
     "get_audit_categories",
+    "start_audit_writer",
+    "stop_audit_writer",
 ]
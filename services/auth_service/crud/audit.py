@@ -3,14 +3,34 @@
 CRUD operations for audit logs.
 Handles all database interactions related to audit logging.
 """
+import asyncio
+import base64
 import logging
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from common.cache import TTLCache
+from common.database.client import schema_client
 from common.schemas.logs import LogCategory
 from supabase import AsyncClient
 
+# Categories are static reference data (readable by everyone), so one shared
+# copy per process is enough
+AUDIT_CATEGORIES_CACHE_TTL_SECONDS = 300
+_categories_cache = TTLCache(maxsize=1, ttl=AUDIT_CATEGORIES_CACHE_TTL_SECONDS)
+_categories_lock = asyncio.Lock()
+
+# Background audit writer: request handlers enqueue rows and a single task
+# inserts them in batches of up to AUDIT_BATCH_SIZE rows, at most
+# AUDIT_FLUSH_INTERVAL_SECONDS after the first row of a batch arrived
+AUDIT_QUEUE_MAX_SIZE = 10_000
+AUDIT_BATCH_SIZE = 100
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.2
+
+_audit_queue: asyncio.Queue[dict | None] | None = None
+_audit_writer_task: asyncio.Task | None = None
+
 
 class AuditOperationError(Exception):
     """Raised when an audit operation fails."""
@@ -29,10 +49,15 @@ async def log_user_action(
     metadata: dict[str, Any] | None = None,
     ip_address: str | None = None,
     user_agent: str | None = None,
+    actor_email: str | None = None,
 ) -> dict | None:
     """
     Registra un evento en la tabla audit.logs.
 
+    With the background writer running (see `start_audit_writer`) the row is
+    only enqueued, so the request doesn't wait on the insert, and `db` is
+    unused. Otherwise (scripts, tests) it is inserted inline.
+
     Args:
         db: Cliente de Supabase (debe ser admin client)
         user_id: UUID del actor
@@ -44,27 +69,12 @@ async def log_user_action(
         metadata: Datos adicionales
         ip_address: IP del cliente
         user_agent: User-Agent del cliente
+        actor_email: Email del actor, si ya se conoce (evita buscarlo)
 
     Returns:
-        Log creado o None si falló
+        Log creado (o encolado) o None si falló
     """
     try:
-        # Obtener email para snapshot
-        actor_email = None
-        if user_id:
-            try:
-                res = (
-                    await db.table("profiles")
-                    .select("email")
-                    .eq("id", str(user_id))
-                    .limit(1)
-                    .execute()
-                )
-                if res.data:
-                    actor_email = res.data[0].get("email")
-            except Exception:
-                pass
-
         payload = {
             "actor_id": str(user_id) if user_id else None,
             "actor_email": actor_email,
@@ -78,7 +88,17 @@ async def log_user_action(
             "user_agent": user_agent,
         }
 
-        response = await db.schema("audit").from_("logs").insert(payload).execute()
+        if _audit_queue is not None:
+            try:
+                _audit_queue.put_nowait(payload)
+                return payload
+            except asyncio.QueueFull:
+                logging.warning("Audit queue full, writing log inline")
+
+        await _resolve_actor_emails(db, [payload])
+        response = (
+            await schema_client(db, "audit").from_("logs").insert(payload).execute()
+        )
 
         return response.data[0] if response.data else None
 
@@ -88,6 +108,164 @@ async def log_user_action(
         return None
 
 
+async def _resolve_actor_emails(db: AsyncClient, rows: list[dict]) -> None:
+    """Fill the `actor_email` snapshot of rows missing it, in one query."""
+    actor_ids = {
+        row["actor_id"] for row in rows if row["actor_id"] and not row["actor_email"]
+    }
+    if not actor_ids:
+        return
+
+    try:
+        res = (
+            await db.table("profiles")
+            .select("id, email")
+            .in_("id", list(actor_ids))
+            .execute()
+        )
+        emails = {p["id"]: p["email"] for p in res.data or []}
+    except Exception:
+        return
+
+    for row in rows:
+        if not row["actor_email"]:
+            row["actor_email"] = emails.get(row["actor_id"])
+
+
+async def _flush_audit_rows(db: AsyncClient, rows: list[dict]) -> None:
+    """
+    Insert a batch of audit rows with a single request.
+
+    The batch insert is all-or-nothing, so if it fails the rows are retried
+    one by one and only the rejected ones are dropped.
+    """
+    await _resolve_actor_emails(db, rows)
+    logs = schema_client(db, "audit").from_("logs")
+    try:
+        await logs.insert(rows).execute()
+        return
+    except Exception as e:
+        if len(rows) == 1:
+            logging.error(f"Error writing audit log: {e}")
+            return
+        logging.warning(f"Error writing {len(rows)} audit logs, retrying each: {e}")
+
+    for row in rows:
+        try:
+            await logs.insert(row).execute()
+        except Exception as e:
+            logging.error(f"Error writing audit log {row.get('action')}: {e}")
+
+
+async def _audit_writer_loop(db: AsyncClient, queue: asyncio.Queue) -> None:
+    """Drain the audit queue in batches until a None sentinel arrives."""
+    loop = asyncio.get_running_loop()
+    stopping = False
+
+    while not stopping:
+        row = await queue.get()
+        if row is None:
+            break
+
+        # Only the empty-batch wait blocks on queue.get(); the rest is drained
+        # with get_nowait, since wait_for(queue.get()) can drop an item that
+        # arrives as the timeout fires (Python < 3.12)
+        batch = [row]
+        deadline = loop.time() + AUDIT_FLUSH_INTERVAL_SECONDS
+        while len(batch) < AUDIT_BATCH_SIZE:
+            try:
+                row = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(remaining)
+                continue
+            if row is None:
+                stopping = True
+                break
+            batch.append(row)
+
+        await _flush_audit_rows(db, batch)
+
+
+def _on_audit_writer_done(task: asyncio.Task) -> None:
+    """If the writer dies unexpectedly, go back to inline writes."""
+    global _audit_queue, _audit_writer_task
+
+    if task is not _audit_writer_task or task.cancelled():
+        return
+    err = task.exception()
+    if err is None:
+        return
+
+    dropped = _audit_queue.qsize() if _audit_queue is not None else 0
+    logging.error(
+        f"Audit writer crashed ({dropped} queued logs lost), "
+        f"writing logs inline from now on: {err!r}"
+    )
+    _audit_queue = None
+    _audit_writer_task = None
+
+
+async def start_audit_writer(db: AsyncClient) -> None:
+    """
+    Start the background task that batches audit log inserts.
+
+    Call from the service lifespan on startup with the admin client.
+    """
+    global _audit_queue, _audit_writer_task
+
+    if _audit_writer_task is not None:
+        return
+
+    _audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAX_SIZE)
+    _audit_writer_task = asyncio.create_task(_audit_writer_loop(db, _audit_queue))
+    _audit_writer_task.add_done_callback(_on_audit_writer_done)
+
+
+async def stop_audit_writer() -> None:
+    """
+    Flush every queued audit row and stop the writer.
+    Call from lifespan on shutdown.
+    """
+    global _audit_queue, _audit_writer_task
+
+    if _audit_writer_task is None:
+        return
+
+    queue = _audit_queue
+    # New logs go inline from here on; the sentinel lands after queued rows
+    _audit_queue = None
+    await queue.put(None)
+    await _audit_writer_task
+    _audit_writer_task = None
+
+
+def encode_audit_cursor(row: dict) -> str:
+    """Opaque keyset cursor pointing just past `row` (by occurred_at, id)."""
+    raw = f"{row['occurred_at']}|{row['id']}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_audit_cursor(cursor: str) -> tuple[str, str]:
+    """
+    Inverse of `encode_audit_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        occurred_at, log_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        )
+        datetime.fromisoformat(occurred_at)
+        UUID(log_id)
+    except Exception as err:
+        raise ValueError("Invalid cursor") from err
+    return occurred_at, log_id
+
+
 async def list_audit_logs(
     db: AsyncClient,
     skip: int = 0,
@@ -98,11 +276,21 @@ async def list_audit_logs(
     action: str | None = None,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
-) -> tuple[list[dict], int]:
+    cursor: str | None = None,
+    exact_count: bool = False,
+) -> tuple[list[dict], int | None, str | None]:
     """
     Lista logs de auditoría con filtros.
     Solo accesible por Platform Admins o Org Admins (según RLS).
 
+    Two pagination modes:
+    - Offset (`skip`): also returns the total. Meant for the first page.
+      The total is PostgREST's `estimated` count (exact for small result
+      sets, planner estimate for large ones) unless `exact_count` is set.
+    - Keyset (`cursor`, from a previous `next_cursor`): seeks directly past
+      the last row seen by (occurred_at, id), so deep pages cost the same
+      as the first. `skip` is ignored and no total is computed.
+
     Args:
         db: Cliente de Supabase
         skip: Offset para paginación
@@ -113,12 +301,31 @@ async def list_audit_logs(
         action: Filtrar por acción
         start_date: Fecha inicio
         end_date: Fecha fin
+        cursor: Cursor de la página anterior (keyset)
+        exact_count: Forzar COUNT(*) exacto en vez del estimado
 
     Returns:
-        Tupla de (lista de logs, total count)
+        Tupla de (lista de logs, total count o None, next_cursor o None)
+
+    Raises:
+        ValueError: Si el cursor es inválido
     """
+    after = decode_audit_cursor(cursor) if cursor else None
+
     try:
-        query = db.schema("audit").from_("logs").select("*", count="exact")
+        if after:
+            query = schema_client(db, "audit").from_("logs").select("*")
+            occurred_at, log_id = after
+            query = query.or_(
+                f'occurred_at.lt."{occurred_at}",'
+                f'and(occurred_at.eq."{occurred_at}",id.lt.{log_id})'
+            )
+        else:
+            query = (
+                schema_client(db, "audit")
+                .from_("logs")
+                .select("*", count="exact" if exact_count else "estimated")
+            )
 
         if organization_id:
             query = query.eq("organization_id", str(organization_id))
@@ -133,13 +340,18 @@ async def list_audit_logs(
         if end_date:
             query = query.lte("occurred_at", end_date.isoformat())
 
-        response = (
-            await query.order("occurred_at", desc=True)
-            .range(skip, skip + limit - 1)
-            .execute()
-        )
+        query = query.order("occurred_at", desc=True).order("id", desc=True)
+        if after:
+            response = await query.limit(limit).execute()
+            total = None
+        else:
+            response = await query.range(skip, skip + limit - 1).execute()
+            total = response.count or 0
 
-        return response.data or [], response.count or 0
+        logs = response.data or []
+        next_cursor = encode_audit_cursor(logs[-1]) if len(logs) == limit else None
+
+        return logs, total, next_cursor
 
     except Exception as err:
         logging.error(f"Error listing audit logs: {err}")
@@ -170,7 +382,7 @@ async def get_user_activity(
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
         response = (
-            await db.schema("audit")
+            await schema_client(db, "audit")
             .from_("logs")
             .select("*")
             .eq("actor_id", str(user_id))
@@ -211,7 +423,7 @@ async def get_organization_activity(
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
         response = (
-            await db.schema("audit")
+            await schema_client(db, "audit")
             .from_("logs")
             .select("*")
             .eq("organization_id", str(organization_id))
@@ -232,22 +444,34 @@ async def get_audit_categories(db: AsyncClient) -> list[dict]:
     """
     Obtiene todas las categorías de auditoría disponibles.
 
+    Cached in-process for AUDIT_CATEGORIES_CACHE_TTL_SECONDS; concurrent
+    misses share a single query.
+
     Args:
         db: Cliente de Supabase
 
     Returns:
         Lista de categorías
     """
+    categories = _categories_cache.get("all")
+    if categories is not None:
+        return categories
+
     try:
-        response = (
-            await db.schema("audit")
-            .from_("categories")
-            .select("*")
-            .order("code")
-            .execute()
-        )
+        async with _categories_lock:
+            categories = _categories_cache.get("all")
+            if categories is None:
+                response = (
+                    await schema_client(db, "audit")
+                    .from_("categories")
+                    .select("*")
+                    .order("code")
+                    .execute()
+                )
+                categories = response.data or []
+                _categories_cache.set("all", categories)
 
-        return response.data or []
+        return categories
 
     except Exception as err:
         logging.error(f"Error fetching audit categories: {err}")
@@ -237,7 +237,22 @@ async def create_organization(
                 f"Organization with slug '{slug}' already exists"
             )
 
-        # Create organization
+        if owner_id:
+            # Organization + owner membership in one transaction
+            response = await db.rpc(
+                "create_org_with_owner",
+                {
+                    "p_name": name,
+                    "p_slug": slug,
+                    "p_type": org_type,
+                    "p_settings": settings or {},
+                    "p_owner": str(owner_id),
+                },
+            ).execute()
+            if not response.data:
+                raise OrganizationOperationError("Failed to create organization")
+            return response.data
+
         response = (
             await db.table("organizations")
             .insert(
@@ -254,13 +269,7 @@ async def create_organization(
         if not response.data:
             raise OrganizationOperationError("Failed to create organization")
 
-        org = response.data[0]
-
-        # Add owner if provided
-        if owner_id:
-            await add_member(db, org["id"], owner_id, role="owner")
-
-        return org
+        return response.data[0]
 
     except (OrganizationExistsError, OrganizationOperationError):
         raise
@@ -399,14 +408,17 @@ async def list_organization_members(
         limit: Max results to return
 
     Returns:
-        Tuple of (list of members with user info, total count)
+        Tuple of (list of members, total count). Each member is a flat row
+        with the user's profile fields (id, email, full_name, avatar_url)
+        plus org_role, membership_status and joined_at, shaped by PostgREST
+        (aliases + spread embed) so no per-row reshaping is needed.
     """
     try:
         query = (
             db.table("organization_members")
             .select(
-                "id, role, status, joined_at, user_id, "
-                "profiles(id, email, full_name, avatar_url)",
+                "org_role:role, membership_status:status, joined_at, "
+                "...profiles!user_id(id, email, full_name, avatar_url)",
                 count="exact",
             )
             .eq("organization_id", str(org_id))
@@ -423,20 +435,7 @@ async def list_organization_members(
             .execute()
         )
 
-        members = []
-        for m in response.data or []:
-            members.append(
-                {
-                    "id": m["id"],
-                    "user_id": m["user_id"],
-                    "role": m["role"],
-                    "status": m["status"],
-                    "joined_at": m["joined_at"],
-                    "user": m.get("profiles"),
-                }
-            )
-
-        return members, response.count or 0
+        return response.data or [], response.count or 0
 
     except Exception as err:
         logging.error(f"Error listing organization members for {org_id}: {err}")
@@ -591,7 +590,7 @@ async def count_owners(
     try:
         response = (
             await db.table("organization_members")
-            .select("id", count="exact")
+            .select("id", count="exact", head=True)
             .eq("organization_id", str(org_id))
             .eq("role", "owner")
             .eq("status", "active")
@@ -7,7 +7,7 @@ import logging
 from typing import Any
 from uuid import UUID
 
-from supabase import AsyncClient
+from supabase import AsyncClient, AuthApiError
 
 
 class ProfileNotFoundError(Exception):
@@ -78,6 +78,28 @@ async def get_profile_by_email(
         raise ProfileOperationError(f"Error al obtener perfil: {err}") from err
 
 
+async def get_profiles_etag(db: AsyncClient) -> str:
+    """
+    Get a validator that changes whenever `profiles` changes.
+
+    Computed by the `profiles_etag()` SQL function from the row count and
+    the latest `updated_at`.
+
+    Args:
+        db: Supabase client (should be admin client)
+
+    Returns:
+        Opaque ETag value (without quotes)
+    """
+    try:
+        response = await db.rpc("profiles_etag").execute()
+        return response.data
+
+    except Exception as err:
+        logging.error(f"Error fetching profiles etag: {err}")
+        raise ProfileOperationError(f"Error al obtener ETag: {err}") from err
+
+
 async def list_all_profiles(
     db: AsyncClient,
     skip: int = 0,
@@ -123,6 +145,8 @@ async def update_profile(
     """
     Update a profile.
 
+    Callers should invalidate the auth profile cache for this user.
+
     Args:
         db: Supabase client
         user_id: UUID of the user
@@ -162,6 +186,8 @@ async def set_platform_admin_status(
     """
     Set or remove Platform Admin status for a user.
 
+    Callers should invalidate the auth profile cache for this user.
+
     Args:
         db: Supabase client (must be admin client)
         user_id: UUID of the user
@@ -202,7 +228,11 @@ async def delete_user_completely(
 
     This removes:
     - The user from Supabase Auth
-    - Their profile (cascade should handle memberships)
+    - Their profile and memberships (ON DELETE CASCADE from auth.users)
+
+    A single Auth admin call; a missing user is reported by GoTrue itself
+    instead of being checked with a separate profile lookup. Callers should
+    invalidate the auth profile cache for this user.
 
     Args:
         db: Supabase client (must be admin client)
@@ -215,16 +245,14 @@ async def delete_user_completely(
     user_id_str = str(user_id)
 
     try:
-        # First verify user exists
-        profile = await get_profile_by_id(db, user_id_str)
-        if not profile:
-            raise ProfileNotFoundError(f"User {user_id_str} not found")
-
-        # Delete from Auth (this should cascade to profile via trigger)
+        # Delete from Auth (cascades to profile and memberships)
         await db.auth.admin.delete_user(user_id_str)
 
-    except ProfileNotFoundError:
-        raise
+    except AuthApiError as err:
+        if err.status == 404:
+            raise ProfileNotFoundError(f"User {user_id_str} not found") from err
+        logging.error(f"Error deleting user {user_id_str}: {err}")
+        raise ProfileOperationError(f"Error al eliminar usuario: {err}") from err
     except Exception as err:
         logging.error(f"Error deleting user {user_id_str}: {err}")
         raise ProfileOperationError(f"Error al eliminar usuario: {err}") from err
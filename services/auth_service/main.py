@@ -9,24 +9,37 @@ This service handles:
 - Membership and role management
 - Audit logging
 """
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 
+from common.auth.security import (
+    jwks_ready,
+    start_jwks_refresher,
+    stop_jwks_refresher,
+)
 from common.config import get_settings
 from common.database.client import (
+    clients_ready,
     close_db_connections,
+    get_admin_client,
     health_check,
+    init_db_connections,
     verify_connection,
 )
 from common.exceptions import OasisException, oasis_exception_handler
 from common.middleware import RateLimitConfig, setup_rate_limiting
 from services.auth_service.api.v1.api import api_router
 from services.auth_service.core.config import settings
+from services.auth_service.crud import start_audit_writer, stop_audit_writer
 
 global_settings = get_settings()
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Application Lifecycle
@@ -39,30 +52,44 @@ async def lifespan(app: FastAPI):
     Application lifecycle manager.
 
     Startup:
+    - Create Supabase clients
     - Verify database connection
-    - Pre-warm connection pool
+    - Start the background audit log writer
+    - Fetch JWKS and start background key refresh
 
     Shutdown:
+    - Flush pending audit logs
+    - Stop JWKS refresh
     - Close database connections
     - Cleanup resources
     """
     # === STARTUP ===
-    print(f"🚀 Starting {settings.PROJECT_NAME} v{settings.VERSION}")
-    print(f"   Environment: {global_settings.ENVIRONMENT}")
+    logger.info(
+        "Starting %s v%s (%s)",
+        settings.PROJECT_NAME,
+        settings.VERSION,
+        global_settings.ENVIRONMENT,
+    )
 
     try:
+        await init_db_connections()
         await verify_connection()
-        print("✅ Database connection verified")
+        logger.info("Database connection verified")
+        await start_audit_writer(await get_admin_client())
     except Exception as e:
-        print(f"⚠️  Database connection warning: {e}")
+        logger.warning("Database connection warning: %s", e)
         # Don't fail startup - allow service to start and retry later
 
+    await start_jwks_refresher()
+
     yield
 
     # === SHUTDOWN ===
-    print("👋 Shutting down...")
+    logger.info("Stopping %s...", settings.PROJECT_NAME)
+    await stop_audit_writer()
+    await stop_jwks_refresher()
     await close_db_connections()
-    print("✅ Shutdown complete")
+    logger.info("Shutdown complete")
 
 
 # ============================================================================
@@ -214,6 +241,24 @@ async def health_check_endpoint(response: Response):
     return result
 
 
+@app.get("/ready", status_code=status.HTTP_200_OK, tags=["System"])
+async def readiness_endpoint(response: Response):
+    """
+    Readiness probe.
+
+    Returns:
+    - 200 OK: Supabase clients created and JWKS keys cached
+    - 503 Service Unavailable: Startup warm-up incomplete
+    """
+    checks = {"database": clients_ready(), "jwks": jwks_ready()}
+    ready = all(checks.values())
+
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return {"status": "ready" if ready else "not_ready", "checks": checks}
+
+
 @app.get("/", include_in_schema=False)
 async def root():
     """Root endpoint redirect to docs."""
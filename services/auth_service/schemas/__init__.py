@@ -8,6 +8,7 @@ from services.auth_service.schemas.audit import (
     PaginatedAuditLogsResponse,
 )
 from services.auth_service.schemas.auth import (
+    AuthUserBrief,
     LoginCredentials,
     PasswordResetRequest,
     PasswordUpdate,
@@ -45,6 +46,7 @@ from services.auth_service.schemas.users import (
 
 __all__ = [
     # Auth
+    "AuthUserBrief",
     "LoginCredentials",
     "PasswordResetRequest",
     "PasswordUpdate",
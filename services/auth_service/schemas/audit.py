@@ -5,7 +5,7 @@ Pydantic schemas for audit logs.
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AuditLogOut(BaseModel):
@@ -24,8 +24,7 @@ class AuditLogOut(BaseModel):
     user_agent: str | None = None
     occurred_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AuditCategoryOut(BaseModel):
@@ -35,14 +34,15 @@ class AuditCategoryOut(BaseModel):
     name: str
     description: str | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaginatedAuditLogsResponse(BaseModel):
     """Paginated response for audit logs."""
 
     items: list[AuditLogOut]
-    total: int
+    # Offset pages only (estimated unless exact_count=true); None on cursor pages
+    total: int | None = None
     skip: int
     limit: int
+    next_cursor: str | None = None  # Pass as `cursor` to fetch the next page
@@ -1,14 +1,17 @@
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
+
+from common.schemas.base import FastEmail
 
 from .organizations import MembershipOut
 
 
 # 1. Auth & Tokens
 class LoginCredentials(BaseModel):
-    email: EmailStr
+    email: FastEmail
     password: str
 
 
@@ -22,12 +25,21 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
 
+class AuthUserBrief(BaseModel):
+    """Subset of the Supabase Auth user returned alongside tokens."""
+
+    id: str
+    email: str | None = None
+    aud: str = "authenticated"
+    created_at: datetime | None = None
+
+
 class TokenSchema(BaseModel):
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
     expires_in: int
-    user: dict[str, Any]
+    user: AuthUserBrief
 
 
 # 2. Gestión de Contraseñas (NUEVO)
@@ -48,8 +60,7 @@ class UserResponse(BaseModel):
     is_platform_admin: bool = False
     memberships: list[MembershipOut] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserUpdate(BaseModel):
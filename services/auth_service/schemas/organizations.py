@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, model_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, model_validator
 
 # ============================================================================
 # Organization Schemas
@@ -53,8 +53,7 @@ class OrganizationOut(OrganizationBase):
     created_at: datetime
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OrganizationDetailOut(OrganizationOut):
@@ -84,8 +83,7 @@ class MemberUserInfo(BaseModel):
     full_name: str | None = None
     avatar_url: str | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -138,8 +136,7 @@ class MembershipOut(BaseModel):
     joined_at: datetime | None = None
     user: MemberUserInfo | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MembershipWithOrg(BaseModel):
@@ -150,8 +147,7 @@ class MembershipWithOrg(BaseModel):
     joined_at: datetime | None = None
     organization: OrganizationOut
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OwnershipTransfer(BaseModel):
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from services.auth_service.schemas.organizations import MembershipWithOrg
 
@@ -46,8 +46,7 @@ class UserAdminOut(BaseModel):
     created_at: datetime
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserDetailOut(UserAdminOut):
@@ -64,8 +63,7 @@ class UserPublicOut(BaseModel):
     full_name: str | None = None
     avatar_url: str | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserMemberOut(BaseModel):
@@ -79,8 +77,7 @@ class UserMemberOut(BaseModel):
     membership_status: str | None = None
     joined_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -66,8 +66,7 @@ async def list_enrollments_admin(
         limit=limit,
     )
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {total} inscripciones.",
         data=enrollments,
         meta={"total": total, "skip": skip, "limit": limit},
@@ -103,8 +102,7 @@ async def get_user_progress(
     if not progress:
         raise NotFoundError("User", str(user_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Progreso del usuario obtenido.",
         data=progress,
     )
@@ -136,8 +134,7 @@ async def get_org_analytics(
 
     analytics = await crud.get_org_analytics(db, UUID(org_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Analytics de organización obtenidos.",
         data=analytics,
     )
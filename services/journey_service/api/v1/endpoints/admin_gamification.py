@@ -50,8 +50,7 @@ async def list_levels(
 
     levels = await crud.list_levels_admin(db, UUID(org_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {len(levels)} niveles.",
         data=levels,
     )
@@ -80,8 +79,7 @@ async def create_level(
     level = await crud.create_level(db, UUID(org_id), payload)
     level["users_at_level"] = 0
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Nivel creado exitosamente.",
         data=level,
     )
@@ -112,8 +110,7 @@ async def update_level(
 
     updated["users_at_level"] = 0  # Placeholder
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Nivel actualizado exitosamente.",
         data=updated,
     )
@@ -145,8 +142,7 @@ async def delete_level(
     if not deleted:
         raise NotFoundError("Level", str(level_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Nivel eliminado exitosamente.",
         data={"deleted_id": str(level_id)},
     )
@@ -172,8 +168,7 @@ async def list_rewards(
 
     rewards = await crud.list_rewards_admin(db, UUID(org_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {len(rewards)} recompensas.",
         data=rewards,
     )
@@ -206,8 +201,7 @@ async def create_reward(
     reward = await crud.create_reward(db, UUID(org_id), payload)
     reward["times_awarded"] = 0
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Recompensa creada exitosamente.",
         data=reward,
     )
@@ -239,8 +233,7 @@ async def update_reward(
     # Get times awarded
     updated["times_awarded"] = 0  # Would need to query
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Recompensa actualizada exitosamente.",
         data=updated,
     )
@@ -272,8 +265,7 @@ async def delete_reward(
     if not deleted:
         raise NotFoundError("Reward", str(reward_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Recompensa eliminada exitosamente.",
         data={"deleted_id": str(reward_id)},
     )
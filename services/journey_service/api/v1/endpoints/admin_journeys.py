@@ -60,8 +60,7 @@ async def list_journeys_admin(
         limit=limit,
     )
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {total} journeys.",
         data=journeys,
         meta={"total": total, "skip": skip, "limit": limit},
@@ -97,8 +96,7 @@ async def create_journey(
     journey["completed_enrollments"] = 0
     journey["completion_rate"] = 0.0
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Journey creado exitosamente.",
         data=journey,
     )
@@ -127,8 +125,7 @@ async def get_journey_admin(
     if not journey:
         raise NotFoundError("Journey", str(journey_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Journey encontrado.",
         data=journey,
     )
@@ -160,8 +157,7 @@ async def update_journey(
     # Get full stats
     journey = await crud.get_journey_admin(db, journey_id)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Journey actualizado exitosamente.",
         data=journey,
     )
@@ -193,8 +189,7 @@ async def delete_journey(
     if not deleted:
         raise NotFoundError("Journey", str(journey_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Journey eliminado exitosamente.",
         data={"deleted_id": str(journey_id)},
     )
@@ -220,8 +215,7 @@ async def publish_journey(
     await crud.publish_journey(db, journey_id)
     journey = await crud.get_journey_admin(db, journey_id)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Journey publicado exitosamente.",
         data=journey,
     )
@@ -247,8 +241,7 @@ async def archive_journey(
     await crud.archive_journey(db, journey_id)
     journey = await crud.get_journey_admin(db, journey_id)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Journey archivado exitosamente.",
         data=journey,
     )
@@ -276,8 +269,7 @@ async def get_journey_stats(
     if not stats:
         raise NotFoundError("Journey", str(journey_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Estadísticas obtenidas.",
         data=stats,
     )
@@ -307,8 +299,7 @@ async def list_steps_admin(
 
     steps = await crud.list_steps_admin(db, journey_id)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {len(steps)} steps.",
         data=steps,
     )
@@ -343,8 +334,7 @@ async def create_step(
     step["total_completions"] = 0
     step["average_points"] = 0.0
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Step creado exitosamente.",
         data=step,
     )
@@ -376,8 +366,7 @@ async def update_step(
 
     step = await crud.get_step_admin(db, step_id)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Step actualizado exitosamente.",
         data=step,
     )
@@ -410,8 +399,7 @@ async def delete_step(
     if not deleted:
         raise NotFoundError("Step", str(step_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Step eliminado exitosamente.",
         data={"deleted_id": str(step_id)},
     )
@@ -445,8 +433,7 @@ async def reorder_steps(
 
     steps = await crud.reorder_steps(db, journey_id, step_orders)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Steps reordenados exitosamente.",
         data=steps,
     )
@@ -87,8 +87,7 @@ async def enroll_user(
             started_at=new_enrollment["started_at"],
         )
 
-        return OasisResponse(
-            success=True,
+        return OasisResponse.ok(
             message="Inscripción creada exitosamente.",
             data=response_data,
         )
@@ -134,8 +133,7 @@ async def get_my_enrollments(
         for e in enrollments
     ]
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {len(response_data)} inscripciones.",
         data=response_data,
     )
@@ -169,8 +167,7 @@ async def get_enrollment_detail(
     if enrollment["user_id"] != str(user_id):
         raise ForbiddenError("No tienes acceso a esta inscripción.")
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Inscripción encontrada.",
         data=enrollment,
     )
@@ -204,8 +201,7 @@ async def get_enrollment_progress(
 
     progress = await crud.get_enrollment_step_progress(db, enrollment_id)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=(
             f"Progreso: {len([p for p in progress if p.get('completed')])} "
             "steps completados."
@@ -255,8 +251,7 @@ async def complete_enrollment(
     # Marcar como completado
     updated = await crud.update_enrollment_status(db, enrollment_id, "completed")
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Journey completado exitosamente.",
         data=EnrollmentResponse(**updated),
     )
@@ -297,8 +292,7 @@ async def drop_enrollment(
 
     updated = await crud.update_enrollment_status(db, enrollment_id, "dropped")
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Journey abandonado. Puedes retomarlo cuando quieras.",
         data=EnrollmentResponse(**updated),
     )
@@ -340,8 +334,7 @@ async def resume_enrollment(
 
     updated = await crud.update_enrollment_status(db, enrollment_id, "active")
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Journey reactivado. Continúa donde lo dejaste.",
         data=EnrollmentResponse(**updated),
     )
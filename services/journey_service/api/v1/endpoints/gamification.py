@@ -47,8 +47,7 @@ async def get_my_stats(
     user_id = UUID(current_user["id"])
     stats = await crud.get_user_stats(db, user_id)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Estadísticas obtenidas.",
         data=stats,
     )
@@ -71,8 +70,7 @@ async def get_my_rewards(
     user_id = UUID(current_user["id"])
     rewards = await crud.get_user_rewards(db, user_id, limit)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {len(rewards)} recompensas.",
         data=rewards,
     )
@@ -95,8 +93,7 @@ async def get_my_activity(
     user_id = UUID(current_user["id"])
     activities = await crud.get_user_activity_log(db, user_id, limit)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {len(activities)} actividades.",
         data=activities,
     )
@@ -119,8 +116,7 @@ async def get_points_history(
     user_id = UUID(current_user["id"])
     history = await crud.get_user_points_history(db, user_id, limit)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {len(history)} transacciones.",
         data=history,
     )
@@ -146,8 +142,7 @@ async def get_leaderboard(
     org_id = UUID(ctx["org_id"])
     leaderboard = await crud.get_leaderboard(db, org_id, limit)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Top {len(leaderboard)} usuarios.",
         data=leaderboard,
     )
@@ -172,8 +167,7 @@ async def get_levels(
     org_id = UUID(ctx["org_id"])
     levels = await crud.get_available_levels(db, org_id)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {len(levels)} niveles.",
         data=levels,
     )
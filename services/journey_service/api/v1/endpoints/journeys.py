@@ -40,8 +40,7 @@ async def list_journeys(
     org_id = ctx.get("org_id")
 
     if not org_id:
-        return OasisResponse(
-            success=True,
+        return OasisResponse.ok(
             message="No hay journeys disponibles.",
             data=[],
             meta={"total": 0, "skip": skip, "limit": limit},
@@ -55,8 +54,7 @@ async def list_journeys(
         limit=limit,
     )
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {total} journeys.",
         data=journeys,
         meta={"total": total, "skip": skip, "limit": limit},
@@ -92,8 +90,7 @@ async def get_journey(
     if not journey:
         raise NotFoundError("Journey", str(journey_id))
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Journey encontrado.",
         data=journey,
     )
@@ -130,8 +127,7 @@ async def get_journey_steps(
 
     steps = await crud.get_steps_by_journey(db, journey_id)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=f"Se encontraron {len(steps)} steps.",
         data=steps,
     )
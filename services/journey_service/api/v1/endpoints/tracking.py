@@ -10,9 +10,9 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.security import HTTPAuthorizationCredentials
 
-from common.auth.security import OrgMemberRequired
+from common.auth.security import OrgMemberRequired, security
 from common.database.client import get_admin_client
 from common.exceptions import ForbiddenError, InternalError, NotFoundError
 from common.middleware import limiter
@@ -33,7 +33,6 @@ from supabase import AsyncClient
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
-security = HTTPBearer()
 
 
 async def verify_step_belongs_to_org(
@@ -165,8 +164,7 @@ async def track_activity(
             # 5. Verificar Nivel (En Background para no ralentizar)
             background_tasks.add_task(check_and_apply_level_up, user_id, new_total, db)
 
-        return OasisResponse(
-            success=True,
+        return OasisResponse.ok(
             message="Actividad registrada correctamente.",
             data=ActivityResponse(
                 points_earned=points_earned,
@@ -271,8 +269,7 @@ async def process_external_event(
 
         if existing.data:
             logger.info(f"Event {payload.external_id} already processed, skipping")
-            return OasisResponse(
-                success=True,
+            return OasisResponse.ok(
                 message="Event already processed",
                 data=ExternalEventResponse(
                     processed=False,
@@ -307,8 +304,7 @@ async def process_external_event(
             f"Could not resolve user for event {payload.external_id}: "
             f"identifier={payload.user_identifier}"
         )
-        return OasisResponse(
-            success=True,
+        return OasisResponse.ok(
             message="User not found, event logged but not processed",
             data=ExternalEventResponse(
                 processed=False,
@@ -427,8 +423,7 @@ async def process_external_event(
             }
         ).execute()
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="External event processed successfully",
         data=ExternalEventResponse(
             processed=True,
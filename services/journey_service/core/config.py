@@ -1,5 +1,3 @@
-from functools import lru_cache
-
 from common.config import CommonSettings
 
 
@@ -23,9 +21,9 @@ class JourneySettings(CommonSettings):
     DEFAULT_POINTS_RESOURCE_VIEW: int = 2
 
 
-@lru_cache
-def get_settings() -> JourneySettings:
-    return JourneySettings()
+settings: JourneySettings = JourneySettings()
 
 
-settings = get_settings()
+def get_settings() -> JourneySettings:
+    """Return the process-wide settings instance."""
+    return settings
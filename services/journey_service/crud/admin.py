@@ -99,7 +99,7 @@ async def get_journey_admin(db: AsyncClient, journey_id: UUID) -> dict | None:
     # Get step count
     steps_resp = (
         await db.table("journeys.steps")
-        .select("id", count="exact")
+        .select("id", count="exact", head=True)
         .eq("journey_id", str(journey_id))
         .execute()
     )
@@ -160,7 +160,7 @@ async def list_journeys_admin(
         # Step count
         steps_resp = (
             await db.table("journeys.steps")
-            .select("id", count="exact")
+            .select("id", count="exact", head=True)
             .eq("journey_id", journey["id"])
             .execute()
         )
@@ -539,7 +539,7 @@ async def list_rewards_admin(db: AsyncClient, org_id: UUID) -> list[dict]:
     for reward in rewards:
         awards_resp = (
             await db.table("journeys.user_rewards")
-            .select("id", count="exact")
+            .select("id", count="exact", head=True)
             .eq("reward_id", reward["id"])
             .execute()
         )
@@ -639,7 +639,7 @@ async def get_journey_stats(db: AsyncClient, journey_id: UUID) -> dict:
     for step in steps_resp.data or []:
         step_completions = (
             await db.table("journeys.step_completions")
-            .select("id", count="exact")
+            .select("id", count="exact", head=True)
             .eq("step_id", step["id"])
             .execute()
         )
@@ -232,7 +232,7 @@ async def can_complete_enrollment(
     # Contar steps totales
     steps_response = (
         await db.table("journeys.steps")
-        .select("id", count="exact")
+        .select("id", count="exact", head=True)
         .eq("journey_id", journey_id)
         .execute()
     )
@@ -241,7 +241,7 @@ async def can_complete_enrollment(
     # Contar steps completados
     completions_response = (
         await db.table("journeys.step_completions")
-        .select("id", count="exact")
+        .select("id", count="exact", head=True)
         .eq("enrollment_id", str(enrollment_id))
         .execute()
     )
@@ -35,7 +35,7 @@ async def get_user_stats(db: AsyncClient, user_id: UUID) -> dict:
     # Enrollments activos y completados
     enrollments_response = (
         await db.table("journeys.enrollments")
-        .select("status", count="exact")
+        .select("status")
         .eq("user_id", str(user_id))
         .execute()
     )
@@ -51,7 +51,7 @@ async def get_user_stats(db: AsyncClient, user_id: UUID) -> dict:
     # Total de actividades
     activities_response = (
         await db.table("journeys.user_activities")
-        .select("id", count="exact")
+        .select("id", count="exact", head=True)
         .eq("user_id", str(user_id))
         .execute()
     )
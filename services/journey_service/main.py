@@ -1,9 +1,19 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
 
-from common.database.client import close_db_connections, verify_connection
+from common.auth.security import (
+    jwks_ready,
+    start_jwks_refresher,
+    stop_jwks_refresher,
+)
+from common.database.client import (
+    clients_ready,
+    close_db_connections,
+    init_db_connections,
+    verify_connection,
+)
 from common.exceptions import OasisException, oasis_exception_handler
 from common.middleware import RateLimitConfig, setup_rate_limiting
 from services.journey_service.api.v1.api import api_router
@@ -18,18 +28,22 @@ async def lifespan(app: FastAPI):
     """Lifecycle manager for the Journey Service."""
     logger.info(f"Starting {settings.PROJECT_NAME}...")
 
-    # Verify database connection on startup
+    # Create Supabase clients and verify the connection on startup
     try:
+        await init_db_connections()
         await verify_connection()
         logger.info("Database connection verified")
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
         raise
 
+    await start_jwks_refresher()
+
     yield
 
     # Cleanup on shutdown
     logger.info(f"Stopping {settings.PROJECT_NAME}...")
+    await stop_jwks_refresher()
     await close_db_connections()
 
 
@@ -74,6 +88,18 @@ async def health_check():
     return {"status": "ok", "service": "journey_service"}
 
 
+@app.get("/ready", tags=["System"])
+async def readiness_check(response: Response):
+    """Readiness probe: 503 until Supabase clients and JWKS keys are warm."""
+    checks = {"database": clients_ready(), "jwks": jwks_ready()}
+    ready = all(checks.values())
+
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return {"status": "ready" if ready else "not_ready", "checks": checks}
+
+
 if __name__ == "__main__":
     import uvicorn
 
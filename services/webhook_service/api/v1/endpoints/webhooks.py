@@ -82,8 +82,7 @@ async def handle_webhook(
     # Process the webhook
     result = await process_webhook(provider_instance, request, background_tasks)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Webhook recibido y encolado para procesamiento",
         data=WebhookReceived(
             trace_id=result["trace_id"],
@@ -118,8 +117,7 @@ async def list_providers():
         for name, info in status["providers"].items()
     }
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=(
             f"{status['configured_providers']} de"
             f"{status['total_providers']} proveedores configurados"
@@ -149,8 +147,7 @@ async def trigger_dlq_retry(
     """
     results = await retry_dlq_events(batch_size=batch_size)
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message=(
             f"Procesados {results['processed']}, "
             f"fallidos {results['failed']}, "
@@ -5,7 +5,6 @@ Centralizes all provider secrets and service settings.
 Provider secrets are accessed via get_secret(provider_name) for consistency.
 """
 
-from functools import lru_cache
 from typing import Any
 
 from pydantic import Field
@@ -110,11 +109,10 @@ class WebhookSettings(CommonSettings):
         extra = "ignore"
 
 
-@lru_cache
-def get_settings() -> WebhookSettings:
-    """Get cached settings instance."""
-    return WebhookSettings()
+# Global settings instance
+settings: WebhookSettings = WebhookSettings()
 
 
-# Global settings instance
-settings = get_settings()
+def get_settings() -> WebhookSettings:
+    """Get the global settings instance."""
+    return settings
@@ -11,6 +11,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from common.database.client import close_db_connections, init_db_connections
 from common.exceptions import OasisException, oasis_exception_handler
 from common.schemas.responses import OasisResponse
 from services.webhook_service.api.v1.api import api_router
@@ -28,6 +29,7 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
 
     On startup:
+    - Crea los clientes de Supabase (persistencia de eventos y DLQ)
     - Descubre y registra todos los proveedores de webhook
     - Valida configuracion de proveedores
     - Log de estado de inicio
@@ -38,6 +40,12 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Iniciando Webhook Service...")
 
+    try:
+        await init_db_connections()
+    except Exception as e:
+        # Persistence degrades gracefully; clients are retried lazily
+        logger.warning(f"No se pudo inicializar Supabase: {e}")
+
     # Initialize provider registry
     registry = get_registry()
     status = registry.get_status()
@@ -85,6 +93,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Deteniendo Webhook Service...")
+    await close_db_connections()
 
 
 API_DESCRIPTION = """
@@ -155,8 +164,7 @@ async def health_check():
     registry = get_registry()
     status = registry.get_status()
 
-    return OasisResponse(
-        success=True,
+    return OasisResponse.ok(
         message="Webhook Service operativo",
         data=HealthStatus(
             status="ok",
@@ -0,0 +1,46 @@
+-- ============================================================================
+-- Custom Access Token Hook
+-- ============================================================================
+-- Adds the profile's platform admin flag to every issued JWT as
+-- app_metadata.is_platform_admin, so the API can authorize requests from
+-- the token alone instead of reading public.profiles on each request.
+--
+-- The claim is refreshed whenever a token is issued/refreshed; changes to
+-- profiles.is_platform_admin take effect on the user's next token.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.custom_access_token_hook(event JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+STABLE
+AS $$
+DECLARE
+    claims JSONB;
+    is_admin BOOLEAN;
+BEGIN
+    SELECT p.is_platform_admin INTO is_admin
+    FROM public.profiles p
+    WHERE p.id = (event->>'user_id')::UUID;
+
+    claims := event->'claims';
+
+    IF claims->'app_metadata' IS NULL THEN
+        claims := jsonb_set(claims, '{app_metadata}', '{}'::JSONB);
+    END IF;
+
+    claims := jsonb_set(
+        claims,
+        '{app_metadata, is_platform_admin}',
+        to_jsonb(COALESCE(is_admin, FALSE))
+    );
+
+    RETURN jsonb_set(event, '{claims}', claims);
+END;
+$$;
+
+-- Only Supabase Auth may call the hook
+GRANT USAGE ON SCHEMA public TO supabase_auth_admin;
+GRANT EXECUTE ON FUNCTION public.custom_access_token_hook(JSONB) TO supabase_auth_admin;
+REVOKE EXECUTE ON FUNCTION public.custom_access_token_hook(JSONB) FROM authenticated, anon, public;
@@ -0,0 +1,16 @@
+-- ============================================================================
+-- Health Check Ping
+-- ============================================================================
+-- Constant-result function used by the services' health checks, so probes
+-- exercise PostgREST + Postgres without touching any table.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.ping()
+RETURNS INT
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT 1;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.ping() TO service_role;
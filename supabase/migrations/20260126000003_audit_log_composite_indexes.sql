@@ -0,0 +1,19 @@
+-- ============================================================================
+-- Audit Log Composite Indexes
+-- ============================================================================
+-- Audit pages filter by organization (org admins) or actor (user activity)
+-- and sort by occurred_at DESC, fetching rows and the total in one PostgREST
+-- request (an estimated count unless `exact_count` is requested). Composite
+-- indexes serve both the filter and the order; they also cover plain
+-- organization_id / actor_id lookups, so the single-column indexes are
+-- dropped.
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_audit_org_date
+    ON audit.logs(organization_id, occurred_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_audit_actor_date
+    ON audit.logs(actor_id, occurred_at DESC);
+
+DROP INDEX IF EXISTS audit.idx_audit_org;
+DROP INDEX IF EXISTS audit.idx_audit_actor;
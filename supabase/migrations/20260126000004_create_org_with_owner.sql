@@ -0,0 +1,40 @@
+-- ============================================================================
+-- Create Organization With Owner
+-- ============================================================================
+-- Inserts an organization and its owner membership in one transaction, so
+-- the API creates both with a single PostgREST request and never leaves an
+-- organization without an owner if the membership insert fails.
+--
+-- A duplicate slug raises unique_violation (SQLSTATE 23505) as before.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.create_org_with_owner(
+    p_name TEXT,
+    p_slug TEXT,
+    p_type TEXT,
+    p_settings JSONB,
+    p_owner UUID
+)
+RETURNS public.organizations
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_org public.organizations;
+BEGIN
+    INSERT INTO public.organizations (name, slug, type, settings)
+    VALUES (p_name, p_slug, p_type::org_type, COALESCE(p_settings, '{}'::JSONB))
+    RETURNING * INTO v_org;
+
+    INSERT INTO public.organization_members (organization_id, user_id, role, status)
+    VALUES (v_org.id, p_owner, 'owner', 'active');
+
+    RETURN v_org;
+END;
+$$;
+
+-- Called by the backend with the service role only
+GRANT EXECUTE ON FUNCTION public.create_org_with_owner(TEXT, TEXT, TEXT, JSONB, UUID)
+    TO service_role;
+REVOKE EXECUTE ON FUNCTION public.create_org_with_owner(TEXT, TEXT, TEXT, JSONB, UUID)
+    FROM authenticated, anon, public;
@@ -0,0 +1,50 @@
+-- ============================================================================
+-- Add Organization Member
+-- ============================================================================
+-- Inserts an active membership and returns it together with its
+-- organization, so the API adds a member with a single PostgREST request
+-- instead of check + insert + re-read.
+--
+-- An existing membership raises unique_violation (SQLSTATE 23505).
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.add_org_member(
+    p_org UUID,
+    p_user UUID,
+    p_role TEXT
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_member public.organization_members;
+BEGIN
+    INSERT INTO public.organization_members (organization_id, user_id, role, status)
+    VALUES (p_org, p_user, p_role::member_role, 'active')
+    ON CONFLICT (organization_id, user_id) DO NOTHING
+    RETURNING * INTO v_member;
+
+    IF v_member.id IS NULL THEN
+        RAISE unique_violation
+            USING MESSAGE = 'User is already a member of this organization';
+    END IF;
+
+    RETURN (
+        SELECT jsonb_build_object(
+            'user_id', v_member.user_id,
+            'role', v_member.role,
+            'status', v_member.status,
+            'joined_at', v_member.joined_at,
+            'organization', to_jsonb(o.*)
+        )
+        FROM public.organizations o
+        WHERE o.id = v_member.organization_id
+    );
+END;
+$$;
+
+-- Called by the backend with the service role only
+GRANT EXECUTE ON FUNCTION public.add_org_member(UUID, UUID, TEXT) TO service_role;
+REVOKE EXECUTE ON FUNCTION public.add_org_member(UUID, UUID, TEXT)
+    FROM authenticated, anon, public;
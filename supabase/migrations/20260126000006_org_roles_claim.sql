@@ -0,0 +1,51 @@
+-- ============================================================================
+-- Organization Roles Claim
+-- ============================================================================
+-- Extends the custom access token hook with app_metadata.org_roles, a map of
+-- organization_id -> role for the user's active memberships, so org admin
+-- endpoints can authorize from the token instead of reading
+-- public.organization_members on each request.
+--
+-- Like is_platform_admin, the claim is refreshed whenever a token is
+-- issued/refreshed; membership changes take effect on the user's next token.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.custom_access_token_hook(event JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+STABLE
+AS $$
+DECLARE
+    claims JSONB;
+    is_admin BOOLEAN;
+    org_roles JSONB;
+BEGIN
+    SELECT p.is_platform_admin INTO is_admin
+    FROM public.profiles p
+    WHERE p.id = (event->>'user_id')::UUID;
+
+    SELECT COALESCE(jsonb_object_agg(m.organization_id, m.role), '{}'::JSONB)
+    INTO org_roles
+    FROM public.organization_members m
+    WHERE m.user_id = (event->>'user_id')::UUID
+      AND m.status = 'active';
+
+    claims := event->'claims';
+
+    IF claims->'app_metadata' IS NULL THEN
+        claims := jsonb_set(claims, '{app_metadata}', '{}'::JSONB);
+    END IF;
+
+    claims := jsonb_set(
+        claims,
+        '{app_metadata, is_platform_admin}',
+        to_jsonb(COALESCE(is_admin, FALSE))
+    );
+
+    claims := jsonb_set(claims, '{app_metadata, org_roles}', org_roles);
+
+    RETURN jsonb_set(event, '{claims}', claims);
+END;
+$$;
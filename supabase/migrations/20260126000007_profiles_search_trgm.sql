@@ -0,0 +1,16 @@
+-- ============================================================================
+-- Profile Search Trigram Indexes
+-- ============================================================================
+-- The admin user list searches with `email ILIKE '%term%' OR
+-- full_name ILIKE '%term%'`. A leading wildcard can't use a b-tree, so every
+-- search scanned all of public.profiles. Trigram GIN indexes on each column
+-- let Postgres answer both branches with a BitmapOr of index scans.
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_profiles_email_trgm
+    ON public.profiles USING gin (email gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_profiles_full_name_trgm
+    ON public.profiles USING gin (full_name gin_trgm_ops);
@@ -0,0 +1,25 @@
+-- ============================================================================
+-- Profiles ETag
+-- ============================================================================
+-- Validator for the admin user list, computed at read time from the row
+-- count and the latest updated_at (kept current by update_profiles_updated_at),
+-- so writes to public.profiles pay nothing extra. A repeated page request is
+-- answered with 304 after this one aggregate instead of the paged query.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.profiles_etag()
+RETURNS TEXT
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT format(
+        '%s-%s',
+        count(*),
+        coalesce(extract(epoch FROM max(updated_at)), 0)
+    )
+    FROM public.profiles;
+$$;
+
+-- Backend only
+REVOKE EXECUTE ON FUNCTION public.profiles_etag() FROM authenticated, anon, public;
+GRANT EXECUTE ON FUNCTION public.profiles_etag() TO service_role;